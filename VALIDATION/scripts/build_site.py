@@ -13,32 +13,95 @@ Changes:
   * Portal:   https://open.canada.ca/data/en/dataset/{dataset_id}
 """
 
-import os, re, json, html, ujson
-from datetime import datetime
+import os, re, io, gzip, html, mmap, hashlib, orjson
+from datetime import datetime, timezone
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, islice
 
 IN_PATH   = os.getenv("VALIDATION_JSONL", "validation_enriched.jsonl")
 OUT_DIR   = os.getenv("SITE_DIR", "VALIDATION")
 SITE_THEME = os.getenv("SITE_THEME", "both").strip().lower()
+# Processes for per-report page rendering: 0/unset = one per CPU, 1 = serial
+SITE_WORKERS = int(os.getenv("SITE_WORKERS") or 0)
+# gzip level (1-9) for precompressed .gz copies of every output; 0/unset = none.
+# Only useful on hosts that serve .gz siblings (nginx gzip_static, S3/CDN uploads);
+# GitHub Pages compresses on the fly and ignores them.
+SITE_GZIP = int(os.getenv("SITE_GZIP") or 0)
+# 1 = keep a manifest of report-page digests in SITE_DIR and skip pages whose input is
+# unchanged since the last build into the same directory; 0/unset = rewrite every page
+SITE_INCREMENTAL = int(os.getenv("SITE_INCREMENTAL") or 0)
+MANIFEST_NAME = ".report-manifest.json"
+
+# Error rows rendered inline per table; the rest (up to ERRORS_MAX) load on "Show all"
+ERRORS_INLINE = 50
+ERRORS_MAX = 1000
+
+# Inputs with more than this many lines are read and rendered in a process pool,
+# each worker parsing its own newline-aligned slice of the JSONL
+PARALLEL_MIN_ITEMS = 200
+PARALLEL_SHARDS_PER_WORKER = 4
 
 # --------------------- Utilities ---------------------
 
-def slugify(s: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9_-]+","-", s or "").strip("-") or "report"
+_escape = html.escape
+
+def _e(s):
+    """Escape for attribute values (quotes included); '' for None/empty."""
+    return _escape(s) if s else ''
+
+def _t(s):
+    """Escape for element text, where quotes cannot break out: skips html.escape's two quote passes."""
+    return _escape(s, False) if s else ''
+
+@lru_cache(maxsize=None)
+def _t_shared(s):
+    """_t() for low-cardinality fields (organization, url_type): escaped once per distinct
+    value per process rather than once per row on every listing page that shows them."""
+    return _t(s)
+
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+# ASCII outside [a-zA-Z0-9_-] -> space, so str.split() finds each run _SLUG_RE would replace
+_SLUG_TABLE = str.maketrans({i: " " for i in range(128) if not (chr(i).isalnum() or chr(i) in "_-")})
 
-def unwrap(val, max_layers=3):
-    seen = 0
-    while isinstance(val, str) and seen < max_layers:
+@lru_cache(maxsize=None)
+def slugify(s: str) -> str:
+    s = s or ""
+    if not s.isascii():
+        return _SLUG_RE.sub("-", s).strip("-") or "report"
+    # one C-level table pass instead of the regex engine; ids (UUIDs) rarely need the join
+    t = s.translate(_SLUG_TABLE)
+    if " " in t:
+        t = "-".join(t.split())
+    return t.strip("-") or "report"
+
+def parse_reports(v, max_layers=3):
+    """-> (report dict or {}, the JSON text it was decoded from, or None if it arrived decoded).
+    Strings are decoded up to `max_layers` times to undo double encoding."""
+    if type(v) is dict:     # already decoded: the common case
+        return v, None
+    text = None
+    for _ in range(max_layers):
+        if type(v) is not str:
+            break
+        # only objects, arrays and (double-encoded) strings are worth a parse attempt
+        s = v.lstrip()
+        if not s or s[0] not in '{["':
+            break
         try:
-            val = ujson.loads(val)
+            decoded = orjson.loads(v)
         except ValueError:
             break
-        seen += 1
-    return val
+        text, v = v, decoded
+    return (v, text) if isinstance(v, dict) else ({}, None)
 
-def parse_reports(v):
-    rep = unwrap(v, 3)
-    return rep if isinstance(rep, dict) else {}
+_PRETTY_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def pretty_json(obj):
+    """Indented UTF-8 JSON bytes for the raw-report files. Everything it is given was decoded by
+    orjson.loads (which reads out-of-range ints as floats), so orjson can always write it back."""
+    return orjson.dumps(obj, option=_PRETTY_OPTS)
 
 STATUS_ALIASES = {
     "passed": "success",
@@ -112,83 +175,179 @@ def ensure_unique_slug(base, used):
 def normalize_org_name(name):
     return (name or "Unknown").strip() or "Unknown"
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def _write_bytes(path, *chunks):
+    """open/write/close on a raw fd: no buffered file object, no fstat for the buffer size.
+    Several chunks go out in one writev() so callers never have to join them first."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        if len(chunks) > 1 and hasattr(os, "writev"):
+            done = os.writev(fd, chunks)
+            if done == sum(map(len, chunks)):
+                return
+            view = memoryview(b"".join(chunks))[done:]     # short write: finish the tail
+        else:
+            view = memoryview(b"".join(chunks) if len(chunks) > 1 else chunks[0])
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def write_file(path, *chunks):
+    """Write the bytes `chunks` to `path`, plus a precompressed `path.gz` when SITE_GZIP is set."""
+    _write_bytes(path, *chunks)
+    if SITE_GZIP:
+        _write_bytes(path + ".gz", gzip.compress(b"".join(chunks), SITE_GZIP, mtime=0))
+
+_worker_fn = None
+
+def _init_worker(fn):
+    # the per-item callable (and whatever its partial binds, e.g. org_lookup) is
+    # unpickled once per worker process instead of once per submitted shard
+    global _worker_fn
+    _worker_fn = fn
+
+def jsonl_shards(path):
+    """`(workers, [(start, end), ...])`: newline-aligned byte ranges of the JSONL at `path`,
+    several per worker so one slow slice doesn't hold up the pool. None when the file has no
+    more than PARALLEL_MIN_ITEMS lines or only one worker is configured: read it serially."""
+    workers = SITE_WORKERS or os.cpu_count() or 1
+    if workers < 2:
+        return None
+    with open(path, "rb") as f:
+        lines = 0
+        for block in iter(partial(f.read, 1 << 20), b""):
+            lines += block.count(b"\n")
+            if lines > PARALLEL_MIN_ITEMS:
+                break
+        else:
+            return None
+        size = os.fstat(f.fileno()).st_size
+        n = workers * PARALLEL_SHARDS_PER_WORKER
+        bounds = [0]
+        for i in range(1, n):
+            # a cut lands just past the newline ending the line it falls in
+            f.seek(max(size * i // n, bounds[-1]))
+            f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return workers, list(zip(bounds, bounds[1:]))
+
+def _run_shard(path, span):
+    return [r for r in map(_worker_fn, iter_items(path, *span)) if r is not None]
+
+def map_jsonl(fn, path):
+    """Call fn(it) for every item of the JSONL at `path` and return its non-None results in
+    file order. Large inputs fan out to processes that each parse and handle their own slice,
+    so parsed reports never cross a process boundary. fn must be picklable (module-level
+    function or partial)."""
+    plan = jsonl_shards(path)
+    if plan is None:
+        return [r for r in map(fn, iter_items(path)) if r is not None]
+    workers, shards = plan
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(fn,)) as ex:
+        return list(chain.from_iterable(
+            [fut.result() for fut in [ex.submit(_run_shard, path, span) for span in shards]]))
+
 # --------------------- Version detection ---------------------
 
-def detect_version(rep_dict):
-    if not isinstance(rep_dict, dict): return "unknown"
+# shared read-only stand-in for a missing block; never mutated
+_EMPTY = {}
+
+def _probe(blk):
+    """(key, version) of the schema list a block carries, tasks before tables; else (None, None)."""
+    if isinstance(blk.get("tasks"), list):  return "tasks", "v0.2"
+    if isinstance(blk.get("tables"), list): return "tables", "v0.1"
+    return None, None
+
+def detect_and_extract(rep_dict):
+    """Return `(version, {"en": [...], "fr": [...]})` from a single walk of the report: the
+    first `tasks`/`tables` list found decides the version and is kept as it is found. Language
+    buckets are preferred, then the report/data holders, then the (very old) top level; a
+    holder or top-level list is filed under "en"."""
+    if not isinstance(rep_dict, dict):
+        return "unknown", {"en": [], "fr": []}
+    get = rep_dict.get
     # language buckets preferred
-    for lang in ("en","fr"):
-        blk = rep_dict.get(lang)
-        if isinstance(blk, dict):
-            if isinstance(blk.get("tasks"), list):  return "v0.2"
-            if isinstance(blk.get("tables"), list): return "v0.1"
-    # generic holders
-    for holder in ("report","data"):
-        blk = rep_dict.get(holder)
-        if isinstance(blk, dict):
-            if isinstance(blk.get("tasks"), list):  return "v0.2"
-            if isinstance(blk.get("tables"), list): return "v0.1"
+    key = version = None
+    en = get("en"); fr = get("fr")
+    if isinstance(en, dict): key, version = _probe(en)
+    else: en = _EMPTY
+    if not isinstance(fr, dict): fr = _EMPTY
+    elif key is None: key, version = _probe(fr)
+    if key is not None:
+        e = en.get(key); f = fr.get(key)
+        if not isinstance(e, list): e = []
+        if not isinstance(f, list): f = []
+        if e or f:
+            return version, {"en": e, "fr": f}
+    # generic holders: the first one carrying the list wins, even an empty one
+    for holder in ("report", "data"):
+        blk = get(holder)
+        if not isinstance(blk, dict): continue
+        if key is None:
+            key, version = _probe(blk)
+            if key is None: continue
+        elif not isinstance(blk.get(key), list):
+            continue
+        if blk[key]:
+            return version, {"en": blk[key], "fr": []}
+        break
     # very old/odd top-level
-    if isinstance(rep_dict.get("tasks"), list):  return "v0.2"
-    if isinstance(rep_dict.get("tables"), list): return "v0.1"
-    return "unknown"
-
-def extract_lang_v02(rep_dict):
-    out = {"en": [], "fr": []}
-    if isinstance(rep_dict.get("en"), dict): out["en"] = rep_dict["en"].get("tasks") or []
-    if isinstance(rep_dict.get("fr"), dict): out["fr"] = rep_dict["fr"].get("tasks") or []
-    if not out["en"] and not out["fr"]:
-        for holder in ("report","data"):
-            blk = rep_dict.get(holder)
-            if isinstance(blk, dict) and isinstance(blk.get("tasks"), list):
-                out["en"] = blk["tasks"]; break
-        if not out["en"] and isinstance(rep_dict.get("tasks"), list):
-            out["en"] = rep_dict["tasks"]
-    return out
-
-def extract_lang_v01(rep_dict):
-    out = {"en": [], "fr": []}
-    if isinstance(rep_dict.get("en"), dict): out["en"] = rep_dict["en"].get("tables") or []
-    if isinstance(rep_dict.get("fr"), dict): out["fr"] = rep_dict["fr"].get("tables") or []
-    if not out["en"] and not out["fr"]:
-        for holder in ("report","data"):
-            blk = rep_dict.get(holder)
-            if isinstance(blk, dict) and isinstance(blk.get("tables"), list):
-                out["en"] = blk["tables"]; break
-        if not out["en"] and isinstance(rep_dict.get("tables"), list):
-            out["en"] = rep_dict["tables"]
-    return out
+    if key is None:
+        key, version = _probe(rep_dict)
+        if key is None:
+            return "unknown", {"en": [], "fr": []}
+    lst = get(key)
+    return version, {"en": lst if isinstance(lst, list) else [], "fr": []}
 
 def agg_v02(tasks):
     if not tasks:
         return {"error_count": 0, "row_count": 0, "valid_all": None, "warning_count": 0}
     err=rows=warns=0; valid_all=True; saw=False
+    # one .get per stat, probed with `type(...) is int` (bools in stats fall back to the lists)
     for t in tasks:
-        st=t.get("stats") or {}
-        err += st.get("errors") if isinstance(st.get("errors"), int) else len(t.get("errors") or [])
-        warns+= st.get("warnings") if isinstance(st.get("warnings"),int) else len(t.get("warnings") or [])
-        rows+= st.get("rows") if isinstance(st.get("rows"), int) else 0
+        st=t.get("stats") or _EMPTY
+        e=st.get("errors");   err  += e if type(e) is int else len(t.get("errors") or ())
+        w=st.get("warnings"); warns+= w if type(w) is int else len(t.get("warnings") or ())
+        r=st.get("rows")
+        if type(r) is int: rows+=r
         v=t.get("valid")
-        if isinstance(v,bool):
+        if v is True or v is False:
             saw=True
             if not v: valid_all=False
     return {"error_count": err, "row_count": rows, "valid_all": (valid_all if saw else None), "warning_count": warns}
 
-def norm_get(table, *keys, default=None):
-    for k in keys:
-        if k in table: return table[k]
-    for k in keys:
-        alt = k.replace("-", "_") if "-" in k else k.replace("_","-")
-        if alt in table: return table[alt]
-    return default
+# v0.1 tables spell the counts either way; hyphenated wins when both are present
+V01_KEY_ALIASES = (("error-count", "error_count"), ("row-count", "row_count"))
+
+def normalize_tables_v01(tables):
+    """The tables with hyphenated count keys renamed to the underscore form, once at ingest.
+    A table needing a rename is shallow-copied first: the originals belong to the decoded
+    report, which is written out as the raw side file and must keep the source spelling."""
+    out = []
+    for t in tables:
+        copied = False
+        for alias, key in V01_KEY_ALIASES:
+            if alias in t:
+                if not copied:
+                    t = {**t}; copied = True
+                t[key] = t.pop(alias)
+        out.append(t)
+    return out
 
 def agg_v01(tables):
     if not tables:
         return {"error_count":0,"row_count":0,"valid_all":None,"warning_count":0}
     err=rows=0; valid_all=True; saw=False
     for t in tables:
-        err+= int(norm_get(t,"error-count","error_count",default=0) or 0)
-        rows+= int(norm_get(t,"row-count","row_count",default=0) or 0)
+        err+= int(t.get("error_count") or 0)
+        rows+= int(t.get("row_count") or 0)
         v=t.get("valid")
         if isinstance(v,bool):
             saw=True
@@ -197,87 +356,199 @@ def agg_v01(tables):
 
 # --------------------- Load & normalize ---------------------
 
+def iter_jsonl(path, start=0, end=None):
+    """Yield one decoded object per non-blank line of the byte range [start, end) (the whole
+    file by default; a range must begin at a line start). The file is memory-mapped and each
+    line's bytes go straight to orjson, skipping the text-mode per-line decode."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            if end is None:
+                end = len(mm)
+            while pos < end:
+                nl = mm.find(b"\n", pos, end)
+                if nl == -1:
+                    nl = end
+                line = mm[pos:nl]
+                pos = nl + 1
+                if line and not line.isspace():
+                    yield orjson.loads(line)
+
+_INTERNED = {}
+
+def iter_items(jsonl_path, start=0, end=None):
+    """Yield one fully parsed item (incl. `raw` and `lang_data`) per JSONL line; `start`/`end`
+    restrict it to a byte range as produced by jsonl_shards()."""
+    # per-line helpers bound as locals: LOAD_FAST instead of a globals lookup per call
+    parse=parse_reports; detect=detect_and_extract; slug=slugify
+    # org/url_type/status repeat across thousands of rows with a few dozen distinct values:
+    # share one str object per value instead of one per row (sys.intern without its limits)
+    intern=_INTERNED.setdefault
+    b=lambda v: (None if v is None else bool(v))
+    for o in iter_jsonl(jsonl_path, start, end):
+        get=o.get
+        rep, rep_text=parse(get("reports"))
+        version, lang_data=detect(rep)
+        created=(get("created") or "").strip()
+
+        if version=="v0.2":
+            en_aggr=agg_v02(lang_data["en"]); fr_aggr=agg_v02(lang_data["fr"])
+        elif version=="v0.1":
+            lang_data["en"]=normalize_tables_v01(lang_data["en"]); lang_data["fr"]=normalize_tables_v01(lang_data["fr"])
+            en_aggr=agg_v01(lang_data["en"]); fr_aggr=agg_v01(lang_data["fr"])
+        else:
+            en_aggr={"error_count":0,"row_count":0,"valid_all":None,"warning_count":0}
+            fr_aggr=en_aggr
+
+        item_id=(get("id") or get("resource_id") or "")
+        d_en=get("dataset_title_en") or ""; d_fr=get("dataset_title_fr") or ""
+        r_en=get("resource_name_en") or ""; r_fr=get("resource_name_fr") or ""
+        status=get("status") or ""; org=get("organization_name") or ""; url_type=get("url_type") or ""
+        status=intern(status, status); org=intern(org, org); url_type=intern(url_type, url_type)
+
+        yield {
+            "id": item_id,
+            "slug": slug(item_id),
+            "resource_id": get("resource_id") or "",
+            "created": created,
+            "status": status,
+            "version": version,
+            # Enriched metadata
+            "organization_name": org,
+            "dataset_id": get("dataset_id") or "",
+            "dataset_title_en": d_en,
+            "dataset_title_fr": d_fr,
+            "resource_name_en": r_en,
+            "resource_name_fr": r_fr,
+            "url_type": url_type,
+            # EN/FR title spans, escaped once here and reused by every row and page that shows them
+            "dataset_html": lang_html(d_en, d_fr),
+            "resource_html": lang_html(r_en, r_fr),
+            # aggregates
+            "en": {"errors": en_aggr["error_count"], "rows": en_aggr["row_count"], "valid": b(en_aggr["valid_all"]), "warnings": en_aggr["warning_count"]},
+            "fr": {"errors": fr_aggr["error_count"], "rows": fr_aggr["row_count"], "valid": b(fr_aggr["valid_all"]), "warnings": fr_aggr["warning_count"]},
+            # what the raw side file is written from: the source JSON text, else the decoded dict
+            "raw": rep if rep_text is None else rep_text,
+            "lang_data": lang_data,
+        }
+
+def created_ms(created):
+    """Epoch milliseconds of an ISO `created` stamp, 0 if unparseable; parsed once here so app.js
+    sorts on an integer instead of calling Date.parse per comparison.
+    A naive stamp is read as UTC, which is what CKAN writes without an offset. The browser's
+    Date.parse read naive date-times as the viewer's local time, which could order them
+    differently against stamps that carry an offset, depending on where the page was viewed."""
+    try:
+        dt = datetime.fromisoformat(created)
+    except ValueError:
+        return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+class ReportRow:
+    """Listing-only view of an item: just the scalar fields the index and organization pages
+    read, held in slots rather than a per-row dict. Of the per-language aggregates only the
+    error counts are kept."""
+    __slots__ = ("id", "slug", "resource_id", "created", "created_ts", "status", "version", "organization_name",
+                 "dataset_id", "dataset_title_en", "dataset_title_fr", "resource_name_en",
+                 "resource_name_fr", "url_type", "dataset_html", "resource_html", "errors_en", "errors_fr",
+                 "row_rest", "record")
+
+    def __init__(self, it):
+        self.id = it["id"]
+        self.slug = it["slug"]
+        self.resource_id = it["resource_id"]
+        self.created = it["created"]
+        self.created_ts = created_ms(it["created"])
+        self.status = it["status"]
+        self.version = it["version"]
+        self.organization_name = it["organization_name"]
+        self.dataset_id = it["dataset_id"]
+        self.dataset_title_en = it["dataset_title_en"]
+        self.dataset_title_fr = it["dataset_title_fr"]
+        self.resource_name_en = it["resource_name_en"]
+        self.resource_name_fr = it["resource_name_fr"]
+        self.url_type = it["url_type"]
+        self.dataset_html = it["dataset_html"]
+        self.resource_html = it["resource_html"]
+        self.errors_en = it["en"]["errors"]
+        self.errors_fr = it["fr"]["errors"]
+        # filled in by the first listing that renders this row
+        self.row_rest = self.record = None
+
+def _read_shard(path, span):
+    return [ReportRow(it) for it in iter_items(path, *span)]
+
 def read_items(jsonl_path):
-    items=[]
-    with open(jsonl_path,"r",encoding="utf-8") as f:
-        for line in f:
-            o=ujson.loads(line)
-            rep=parse_reports(o.get("reports"))
-            version=detect_version(rep)
-            created=(o.get("created") or "").strip()
-
-            if version=="v0.2":
-                lang_data=extract_lang_v02(rep)
-                en_aggr=agg_v02(lang_data["en"]); fr_aggr=agg_v02(lang_data["fr"])
-            elif version=="v0.1":
-                lang_data=extract_lang_v01(rep)
-                en_aggr=agg_v01(lang_data["en"]); fr_aggr=agg_v01(lang_data["fr"])
-            else:
-                lang_data={"en":[],"fr":[]}
-                en_aggr={"error_count":0,"row_count":0,"valid_all":None,"warning_count":0}
-                fr_aggr=en_aggr
-
-            b=lambda v: (None if v is None else bool(v))
-
-            items.append({
-                "id": (o.get("id") or o.get("resource_id") or ""),
-                "resource_id": o.get("resource_id") or "",
-                "created": created,
-                "status": o.get("status") or "",
-                "version": version,
-                # Enriched metadata
-                "organization_name": o.get("organization_name") or "",
-                "dataset_id": o.get("dataset_id") or "",
-                "dataset_title_en": o.get("dataset_title_en") or "",
-                "dataset_title_fr": o.get("dataset_title_fr") or "",
-                "resource_name_en": o.get("resource_name_en") or "",
-                "resource_name_fr": o.get("resource_name_fr") or "",
-                "url_type": o.get("url_type") or "",
-                # aggregates
-                "en": {"errors": en_aggr["error_count"], "rows": en_aggr["row_count"], "valid": b(en_aggr["valid_all"]), "warnings": en_aggr["warning_count"]},
-                "fr": {"errors": fr_aggr["error_count"], "rows": fr_aggr["row_count"], "valid": b(fr_aggr["valid_all"]), "warnings": fr_aggr["warning_count"]},
-                "rep": rep,
-                "lang_data": lang_data,
-            })
-    return items
+    """Index/org rows only (ReportRow): the parsed report payload is dropped once aggregated.
+    Detail pages re-read the file via map_jsonl() so only one record is parsed at a time.
+    Large files are parsed slice by slice in a process pool; rows keep the file's order."""
+    plan = jsonl_shards(jsonl_path)
+    if plan is None:
+        return [ReportRow(it) for it in iter_items(jsonl_path)]
+    workers, shards = plan
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(chain.from_iterable(ex.map(partial(_read_shard, jsonl_path), shards)))
 
 def build_org_groups(items):
     used_slugs = set()
     groups = {}
+    # raw organization_name -> (its group's items.append, its group's tally of raw
+    # (status, url_type) pairs): one dict probe and one counter bump per item, the group's
+    # own keys bound once per org; normalization then runs once per distinct value instead
+    # of once per row (the fields are low-cardinality and interned at load)
+    by_raw = {}
+    pairs = {}
     for it in items:
-        org_name = normalize_org_name(it.get("organization_name"))
-        group = groups.get(org_name)
-        if group is None:
-            slug_base = slugify(org_name)
-            slug = ensure_unique_slug(slug_base, used_slugs)
-            group = {
-                "name": org_name,
-                "slug": slug,
-                "items": [],
-                "status_counts": Counter(),
-                "url_counts": Counter(),
-                "status_by_url": defaultdict(Counter),
-                "url_labels": {},
-            }
-            groups[org_name] = group
-
-        group["items"].append(it)
-
-        status_key = normalize_status(it.get("status"))
-        group["status_counts"][status_key] += 1
-
-        url_key, url_label = normalize_url_type(it.get("url_type"))
-        group["url_counts"][url_key] += 1
-        group["status_by_url"][url_key][status_key] += 1
-        if url_label:
-            group["url_labels"].setdefault(url_key, url_label)
+        slot = by_raw.get(it.organization_name)
+        if slot is None:
+            org_name = normalize_org_name(it.organization_name)
+            group = groups.get(org_name)
+            if group is None:
+                slug_base = slugify(org_name)
+                slug = ensure_unique_slug(slug_base, used_slugs)
+                group = {
+                    "name": org_name,
+                    "slug": slug,
+                    "items": [],
+                    "status_counts": Counter(),
+                    "url_counts": Counter(),
+                    "status_by_url": defaultdict(Counter),
+                    "url_labels": {},
+                }
+                groups[org_name] = group
+                pairs[org_name] = Counter()
+            slot = by_raw[it.organization_name] = (group["items"].append, pairs[org_name])
+
+        add, tally = slot
+        add(it)
+        tally[it.status, it.url_type] += 1
+
+    # pairs are in first-seen order, so counters and labels fill in the same order as a
+    # per-item pass would
+    norm_status = normalize_status; norm_url = normalize_url_type
+    for org_name, group in groups.items():
+        status_counts = group["status_counts"]; url_counts = group["url_counts"]
+        status_by_url = group["status_by_url"]; url_labels = group["url_labels"]
+        for (status, url_type), n in pairs[org_name].items():
+            status_key = norm_status(status)
+            url_key, url_label = norm_url(url_type)
+            status_counts[status_key] += n
+            url_counts[url_key] += n
+            status_by_url[url_key][status_key] += n
+            if url_label:
+                url_labels.setdefault(url_key, url_label)
 
     org_groups = []
     for group in groups.values():
-        items_sorted = sorted(group["items"], key=lambda x: (x.get("created") or ""), reverse=True)
+        items_sorted = sorted(group["items"], key=lambda x: x.created, reverse=True)
         group["items"] = items_sorted
         group["total"] = len(items_sorted)
-        group["latest_created"] = max((x.get("created") or "" for x in items_sorted), default="")
+        # sorted newest first, so the latest stamp is the head's
+        group["latest_created"] = items_sorted[0].created if items_sorted else ""
         group["status_order"] = order_status_keys(group["status_counts"])
         group["url_order"] = sorted(
             group["url_counts"],
@@ -288,6 +559,11 @@ def build_org_groups(items):
     org_groups.sort(key=lambda g: g["name"].lower())
     return org_groups
 
+def script_json(obj):
+    """JSON text for an inline <script>: orjson, with "<" escaped as \\u003c so a label
+    containing "</script>" or "<!--" cannot end the element."""
+    return orjson.dumps(obj).decode("utf-8").replace("<", "\\u003c")
+
 def prepare_org_summary(group):
     success = group["status_counts"].get("success", 0)
     failure = group["status_counts"].get("failure", 0)
@@ -300,34 +576,30 @@ def prepare_org_summary(group):
     status_labels = [display_status(s) for s in status_order]
     status_values = [group["status_counts"].get(s, 0) for s in status_order]
     status_colors = [STATUS_COLORS.get(s, DEFAULT_STATUS_COLOR) for s in status_order]
-    status_data_json = json.dumps(
-        {
-            "labels": status_labels,
-            "datasets": [{
-                "label": "Reports",
-                "data": status_values,
-                "backgroundColor": status_colors,
-                "hoverOffset": 8,
-            }]
-        },
-        ensure_ascii=False,
-    )
+    status_data_json = script_json({
+        "labels": status_labels,
+        "datasets": [{
+            "label": "Reports",
+            "data": status_values,
+            "backgroundColor": status_colors,
+            "hoverOffset": 8,
+        }]
+    })
 
     url_order = group.get("url_order") or []
     if not url_order:
         url_order = ["unknown"]
     url_labels = [group["url_labels"].get(u, "Unknown") for u in url_order]
+    # per-url status counters, looked up once and shared by every status series and table row
+    by_url = [group["status_by_url"].get(u, _EMPTY) for u in url_order]
     stacked_datasets = []
-    for status_key in status_order:
-        data_points = [
-            group["status_by_url"].get(u, Counter()).get(status_key, 0)
-            for u in url_order
-        ]
+    for status_key, color in zip(status_order, status_colors):
+        data_points = [counts.get(status_key, 0) for counts in by_url]
         if any(data_points):
             stacked_datasets.append({
                 "label": display_status(status_key),
                 "data": data_points,
-                "backgroundColor": STATUS_COLORS.get(status_key, DEFAULT_STATUS_COLOR),
+                "backgroundColor": color,
                 "stack": "status",
                 "borderWidth": 0,
             })
@@ -339,22 +611,16 @@ def prepare_org_summary(group):
             "stack": "status",
             "borderWidth": 0,
         })
-    url_chart_json = json.dumps(
-        {
-            "labels": url_labels,
-            "datasets": stacked_datasets,
-        },
-        ensure_ascii=False,
-    )
+    url_chart_json = script_json({
+        "labels": url_labels,
+        "datasets": stacked_datasets,
+    })
 
     status_table_rows = []
-    for url_key in url_order:
-        label = group["url_labels"].get(url_key, "Unknown")
-        counts = group["status_by_url"].get(url_key, Counter())
-        total = group["url_counts"].get(url_key, 0)
+    for url_key, label, counts in zip(url_order, url_labels, by_url):
         status_table_rows.append({
             "label": label,
-            "total": total,
+            "total": group["url_counts"].get(url_key, 0),
             "counts": [counts.get(status_key, 0) for status_key in status_order],
         })
 
@@ -434,42 +700,60 @@ let currentPage = 1;
 const reportTable = document.querySelector('[data-report-table]');
 const reportTableBody = reportTable ? reportTable.querySelector('tbody') : null;
 
-function getRows(){ return reportTableBody ? Array.from(reportTableBody.querySelectorAll('tr')) : []; }
-function visibleFilteredRows(){ return getRows().filter(r => r.dataset.filtered !== '0'); }
+// Rows come from the JSON file named by the table's data-src (index pages) or the
+// #report-items JSON block emitted next to the table (organization pages);
+// sort/filter work on this array and only the current page is put in the DOM.
+// Every text field is lowercased at build time, including item.search, the row's
+// searchable text; only the user's input needs lowering. `created` sorts on created_ts,
+// epoch ms computed at build time, rather than a Date.parse per comparison.
+const itemsBlock = document.getElementById('report-items');
+let reportItems = itemsBlock ? JSON.parse(itemsBlock.textContent) : [];
+let filteredItems = reportItems;
+
+function loadItems(){
+  const src = reportTable && reportTable.dataset.src;
+  if(!src) return Promise.resolve(true);
+  return fetch(src)
+    .then(r=>{ if(!r.ok) throw new Error(r.status); return r.json(); })
+    .then(items=>{ reportItems = filteredItems = items; return true; })
+    .catch(()=>{
+      const info = document.querySelector('#pager-info');
+      if(info) info.textContent = 'Could not load ' + src;
+      return false;
+    });
+}
+
+function toRow(item){ return item.html; }
 
-function getCellValue(row, key){
-  if(key==='created')     return (row.dataset.created    || '').toLowerCase();
-  if(key==='status')      return (row.dataset.status     || '').toLowerCase();
-  if(key==='resource')    return (row.dataset.resource   || '').toLowerCase();
-  if(key==='organization')return (row.dataset.org        || '').toLowerCase();
-  if(key==='version')     return (row.dataset.version    || '').toLowerCase();
+function getCellValue(item, key){
+  if(key==='created')     return item.created;
+  if(key==='status')      return item.status;
+  if(key==='resource')    return item.resource;
+  if(key==='organization')return item.org;
+  if(key==='version')     return item.version;
 
   // Dataset sorts by visible language (EN/FR)
   if(key==='dataset'){
     const lang = (localStorage.getItem('vr_lang') || 'en').toLowerCase();
-    if(lang === 'fr') return (row.dataset.datasetFr || '').toLowerCase();
-    return (row.dataset.datasetEn || '').toLowerCase();
+    return lang === 'fr' ? item.dataset_fr : item.dataset_en;
   }
 
-  return row.innerText.toLowerCase();
+  return item.search;
 }
 
 function sortBy(key){
   if(!reportTableBody) return;
-  const rows = getRows();
-  if(!rows.length) return;
+  if(!reportItems.length) return;
   sortState.dir = (sortState.key === key) ? -sortState.dir : 1;
   sortState.key = key;
 
-  rows.sort((a,b)=>{
+  const cmp = (a,b)=>{
     const va = getCellValue(a, key), vb = getCellValue(b, key);
-    if(key==='created'){
-      const da = Date.parse(va)||0, db = Date.parse(vb)||0;
-      if(da!==db) return (da - db) * sortState.dir;
-    }
+    if(key==='created' && a.created_ts!==b.created_ts) return (a.created_ts - b.created_ts) * sortState.dir;
     return va.localeCompare(vb) * sortState.dir;
-  });
-  rows.forEach(r=>reportTableBody.appendChild(r));
+  };
+  reportItems.sort(cmp);
+  if(filteredItems !== reportItems) filteredItems.sort(cmp);
   updateSortIndicators();
   renderPage(1);
 }
@@ -493,33 +777,44 @@ function applyFilters(){
   const oF  = (document.querySelector('#filter-org')?.value || '').toLowerCase().trim();
   const vF  = (document.querySelector('#filter-version')?.value || '').toLowerCase().trim();
 
-  getRows().forEach(r=>{
-    const text = r.innerText.toLowerCase();
-    const dres = (r.dataset.resource || '').toLowerCase();
-    const dsta = (r.dataset.status   || '').toLowerCase();
-    const dcre = (r.dataset.created  || '').toLowerCase();
-    const dorg = (r.dataset.org      || '').toLowerCase();
-    const dver = (r.dataset.version  || '').toLowerCase();
-
-    let show = true;
-    if(q && !text.includes(q)) show = false;
-    if(rF && !dres.includes(rF)) show = false;
-    if(sF && dsta !== sF) show = false;
-    if(cF && !dcre.includes(cF)) show = false;
-    if(oF && !dorg.includes(oF)) show = false;
-    if(vF && dver !== vF) show = false;
-
-    r.dataset.filtered = show ? '1' : '0';
-  });
+  if(!q && !rF && !sF && !cF && !oF && !vF){
+    filteredItems = reportItems;
+  } else {
+    filteredItems = reportItems.filter(r=>{
+      if(q && !r.search.includes(q)) return false;
+      if(rF && !r.resource.includes(rF)) return false;
+      if(sF && r.status !== sF) return false;
+      if(cF && !r.created.includes(cF)) return false;
+      if(oF && !r.org.includes(oF)) return false;
+      if(vF && r.version !== vF) return false;
+      return true;
+    });
+  }
   renderPage(1);
 }
 function filterTable(){ applyFilters(); }
 
-function setLang(lang){
-  localStorage.setItem('vr_lang', lang);
-  document.querySelectorAll('[data-lang]').forEach(el=>{
+// Typing fires one input event per key; coalesce a burst into a single filter
+// pass that runs when the browser is idle (bounded so results never lag far).
+let filterQueued = false;
+const whenIdle = window.requestIdleCallback
+  ? fn => window.requestIdleCallback(fn, { timeout: 150 })
+  : fn => setTimeout(fn, 0);
+function scheduleFilters(){
+  if(filterQueued) return;
+  filterQueued = true;
+  whenIdle(()=>{ filterQueued = false; applyFilters(); });
+}
+
+function applyLang(root, lang){
+  root.querySelectorAll('[data-lang]').forEach(el=>{
     el.style.display = (el.dataset.lang===lang) ? '' : 'none';
   });
+}
+
+function setLang(lang){
+  localStorage.setItem('vr_lang', lang);
+  applyLang(document, lang);
   document.querySelectorAll('.lang-toggle button').forEach(b=>{
     b.classList.toggle('active', b.dataset.set===lang);
   });
@@ -538,13 +833,12 @@ function gotoNext(){
 
 function renderPage(page){
   if(!reportTableBody) return;
-  const rows = visibleFilteredRows();
-  const total = rows.length;
+  const total = filteredItems.length;
   const totalPages = Math.max(1, Math.ceil(total/pageSize));
   currentPage = Math.max(1, Math.min(page, totalPages));
-  getRows().forEach(r => { r.style.display='none'; });
   const start=(currentPage-1)*pageSize, end=start+pageSize;
-  rows.slice(start,end).forEach(r => { r.style.display=''; });
+  reportTableBody.innerHTML = filteredItems.slice(start,end).map(toRow).join('');
+  applyLang(reportTableBody, localStorage.getItem('vr_lang')||'en');
   const info = document.querySelector('#pager-info');
   if(info){
     const shownStart = total ? (start+1) : 0;
@@ -553,93 +847,155 @@ function renderPage(page){
   }
 }
 
+// Report pages: append the error rows held back in the table's JSON blob
+function showAllErrors(btn){
+  const table = document.getElementById(btn.dataset.errs);
+  const blob = document.getElementById(btn.dataset.errs + '-rest');
+  if(!table || !blob) return;
+  const frag = document.createDocumentFragment();
+  JSON.parse(blob.textContent).forEach(cells=>{
+    const tr = document.createElement('tr');
+    cells.forEach(v=>{ const td = document.createElement('td'); td.textContent = v; tr.appendChild(td); });
+    frag.appendChild(tr);
+  });
+  table.querySelector('tbody').appendChild(frag);
+  blob.remove();
+  btn.parentNode.remove();
+}
+
 window.addEventListener('DOMContentLoaded',()=>{
   setLang(localStorage.getItem('vr_lang')||'en');
+  // GCDS report pages leave their date to app.js, which is rewritten on every build
+  document.querySelectorAll('gcds-date-modified[data-build-date]').forEach(el=>{ el.textContent = BUILD_DATE; });
   ['#q','#filter-resource','#filter-status','#filter-created','#filter-org','#filter-version'].forEach(sel=>{
     const el=document.querySelector(sel); if(!el) return;
-    el.addEventListener('input', applyFilters);
-    el.addEventListener('change', applyFilters);
+    el.addEventListener('input', scheduleFilters);
+    el.addEventListener('change', scheduleFilters);
   });
   const ps=document.querySelector('#page-size');
   if(ps) ps.addEventListener('change', e=> setPageSize(e.target.value));
 
   if(reportTableBody){
-    getRows().forEach(r=> r.dataset.filtered='1');
     updateSortIndicators();
-    setPageSize(document.querySelector('#page-size')?.value || 25);
+    pageSize = parseInt(document.querySelector('#page-size')?.value, 10) || 25;
+    // filters typed while the rows were loading apply as soon as they arrive
+    loadItems().then(ok=>{ if(ok) applyFilters(); });
   }
 });
 """
 
 # --------------------- Render helpers ---------------------
 
+_BADGE = {
+    True:  '<span class="badge ok">OK</span>',
+    False: '<span class="badge bad">FAIL</span>',
+    None:  '<span class="badge na">N/A</span>',
+}
+# chip class for a raw status value; anything else renders as 'na'
+_STATUS_CLS = {"success": "ok", "failure": "bad"}
+
 def badge_state(ok):
-    if ok is True:  return '<span class="badge ok">OK</span>'
-    if ok is False: return '<span class="badge bad">FAIL</span>'
-    return '<span class="badge na">N/A</span>'
+    # only real booleans count (1/0 would otherwise hash onto True/False)
+    return _BADGE[ok] if type(ok) is bool else _BADGE[None]
 
 def chip(text, cls=""):
     cls_str = f" {cls}" if cls else ""
-    return f'<span class="badge{cls_str}">{html.escape(str(text))}</span>'
+    return f'<span class="badge{cls_str}">{_t(str(text))}</span>'
+
+@lru_cache(maxsize=None)
+def _chip_shared(text, cls=""):
+    """chip() for the closed sets of versions and statuses: built once per (text, cls)."""
+    return chip(text, cls)
 
 def lang_html(en, fr):
-    return (f'<span data-lang="en">{html.escape(en or "")}</span>'
-            f'<span data-lang="fr" style="display:none">{html.escape(fr or "")}</span>')
+    return (f'<span data-lang="en">{_t(en or "")}</span>'
+            f'<span data-lang="fr" style="display:none">{_t(fr or "")}</span>')
 
-def render_report_row(it, link_prefix="reports"):
-    slug = slugify(it['id'])
-    prefix = (link_prefix or "").rstrip("/")
-    link = f"{prefix}/{slug}.html" if prefix else f"{slug}.html"
-    created = it['created'] or ''
-    status  = it['status'] or ''
-    resource_code = it['resource_id'] or '-'
-    version = it['version'] or 'unknown'
-    org     = it['organization_name'] or ''
-    d_en, d_fr = it.get("dataset_title_en",""), it.get("dataset_title_fr","")
-    r_en, r_fr = it.get("resource_name_en",""), it.get("resource_name_fr","")
-
-    en_err = f"{it['en']['errors']} err"
-    fr_err = f"{it['fr']['errors']} err."
-    err_cell = f'<span data-lang="en">{en_err}</span><span data-lang="fr" style="display:none">{fr_err}</span>'
-
-    ver_chip= chip(version, "na")
-    st_chip = chip(status, 'na' if status not in ('success','failure') else ('ok' if status=='success' else 'bad'))
-
-    dataset_cell = f'{lang_html(d_en, d_fr)}<div class="small"><code>{html.escape(it["dataset_id"])}</code></div>'
-    resource_cell= f'{lang_html(r_en, r_fr)}<div class="small"><code>{html.escape(resource_code)}</code> · {html.escape(it.get("url_type") or "")}</div>'
-
-    return f"""
-      <tr data-created="{html.escape(created)}"
-          data-status="{html.escape(status.lower())}"
-          data-resource="{html.escape(resource_code)}"
-          data-organization="{html.escape(org)}"
-          data-org="{html.escape(org)}"
-          data-version="{html.escape(version.lower())}"
-          data-dataset-en="{html.escape(d_en)}"
-          data-dataset-fr="{html.escape(d_fr)}"
-          data-filtered="1">
+# a row differs between listings only in its link's prefix: _ROW_LINK + href + _ROW_REST
+_ROW_LINK = """
+      <tr>
         <td>
-          <a href="{link}"><code>{html.escape(it['id'])}</code></a>
-          <div class="subtle">{ver_chip}</div>
+          <a href=\""""
+_ROW_REST = """"><code>%s</code></a>
+          <div class="subtle">%s</div>
         </td>
-        <td>{dataset_cell}</td>
-        <td>{resource_cell}</td>
-        <td>{html.escape(org)}</td>
-        <td>{err_cell}</td>
-        <td>{st_chip}</td>
-        <td><time>{html.escape(created)}</time></td>
+        <td>%s<div class="small"><code>%s</code></div></td>
+        <td>%s<div class="small"><code>%s</code> · %s</div></td>
+        <td>%s</td>
+        <td><span data-lang="en">%s err</span><span data-lang="fr" style="display:none">%s err.</span></td>
+        <td>%s</td>
+        <td><time>%s</time></td>
       </tr>
     """
 
-# --------------------- Index page ---------------------
+def render_report_row(it, link_prefix="reports"):
+    """The report's <tr>. Everything after the link is rendered on first use and kept on the
+    row, so the index and organization listings of both themes format it only once."""
+    rest = it.row_rest
+    if rest is None:
+        status = it.status
+        rest = it.row_rest = _ROW_REST % (
+            _t(it.id),
+            _chip_shared(it.version or 'unknown', "na"),
+            it.dataset_html, _t(it.dataset_id),
+            it.resource_html, _t(it.resource_id or '-'),
+            _t_shared(it.url_type),
+            _t_shared(it.organization_name),
+            it.errors_en, it.errors_fr,
+            _chip_shared(status, _STATUS_CLS.get(status, 'na')),
+            _t(it.created),
+        )
+    prefix = (link_prefix or "").rstrip("/")
+    slug = it.slug
+    return _ROW_LINK + (f"{prefix}/{slug}.html" if prefix else f"{slug}.html") + rest
+
+def report_record(it, link_prefix="reports"):
+    """Sort/filter fields for one table row, plus its pre-rendered <tr>. Text fields are
+    lowercased here so app.js compares them as-is; `created_ts` is the sort key for `created`.
+    The link-independent fields are built once per row and reused by every listing."""
+    fields = it.record
+    if fields is None:
+        fields = it.record = report_fields(it)
+    record = fields.copy()
+    record["html"] = render_report_row(it, link_prefix)
+    return record
+
+def report_fields(it):
+    return {
+        "created": it.created.lower(),
+        "created_ts": it.created_ts,
+        "status": it.status.lower(),
+        "resource": (it.resource_id or '-').lower(),
+        "org": it.organization_name.lower(),
+        "version": (it.version or 'unknown').lower(),
+        "dataset_en": it.dataset_title_en.lower(),
+        "dataset_fr": it.dataset_title_fr.lower(),
+        "search": " ".join((
+            it.id, it.dataset_title_en, it.dataset_title_fr, it.dataset_id,
+            it.resource_name_en, it.resource_name_fr, it.resource_id or '-',
+            it.url_type, it.organization_name, it.status,
+            it.created, it.version or 'unknown',
+        )).lower(),
+    }
 
-def write_index(items, out_dir):
-    rows = [render_report_row(it) for it in items]
+def report_records_json(items, link_prefix="reports"):
+    record = report_record
+    return orjson.dumps([record(it, link_prefix) for it in items])
+
+def render_report_data(items, link_prefix="reports"):
+    """Embed the report table rows as an inert JSON data block; app.js renders one page at a time.
+    Returned as bytes, written between the page's head and tail without a str round trip."""
+    # \u003c keeps "</script>" / "<!--" in titles from ending the script element
+    records = report_records_json(items, link_prefix).replace(b"<", b"\\u003c")
+    return b'<script type="application/json" id="report-items">' + records + b'</script>'
 
-    html_index = f"""<!doctype html><html lang="en"><head>
+# --------------------- Index page ---------------------
+
+_INDEX_HTML = """<!doctype html><html lang="en"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
 <title>Validation Reports</title>
 <link rel="stylesheet" href="style.css"><script defer src="app.js"></script>
+<link rel="preload" href="index.json" as="fetch" crossorigin="anonymous">
 </head><body>
   <div class="container">
     <div class="header">
@@ -665,7 +1021,7 @@ def write_index(items, out_dir):
       </div>
 
       <div class="table-wrap">
-        <table class="table" data-report-table>
+        <table class="table" data-report-table data-src="index.json">
           <thead>
             <tr>
               <th>ID</th>
@@ -708,12 +1064,9 @@ def write_index(items, out_dir):
               </th>
             </tr>
           </thead>
-          <tbody>
-            {''.join(rows)}
-          </tbody>
+          <tbody></tbody>
         </table>
       </div>
-
       <div class="pager">
         <span class="subtle" id="pager-info"></span>
         <span class="subtle">Rows per page</span>
@@ -735,8 +1088,10 @@ def write_index(items, out_dir):
   </div>
 </body></html>"""
 
-    with open(os.path.join(out_dir,"index.html"), "w", encoding="utf-8") as f:
-        f.write(html_index)
+def write_index(items, out_dir):
+    # rows ship as index.json, fetched by app.js, so the page itself is a static shell
+    write_file(os.path.join(out_dir,"index.json"), report_records_json(items))
+    write_file(os.path.join(out_dir,"index.html"), _INDEX_HTML.encode("utf-8"))
 
 def write_org_index(org_groups, out_dir):
     org_dir = os.path.join(out_dir, "organizations")
@@ -751,10 +1106,10 @@ def write_org_index(org_groups, out_dir):
         latest_created = group.get("latest_created") or "N/A"
         match = f"{group['name']} {success} {failure} {other} {url_types_count}".lower()
         items_html.append(f"""
-      <li class="panel section" data-match="{html.escape(match)}">
+      <li class="panel section" data-match="{_e(match)}">
         <div style="display:flex; align-items:center; justify-content:space-between; gap:12px; flex-wrap:wrap">
-          <div class="h1" style="font-size:18px">{html.escape(group['name'])}</div>
-          <a class="btn" href="{html.escape(group['slug'])}.html">Open report</a>
+          <div class="h1" style="font-size:18px">{_e(group['name'])}</div>
+          <a class="btn" href="{_e(group['slug'])}.html">Open report</a>
         </div>
         <div class="summary-grid" style="margin-top:16px">
           <div class="summary-tile">
@@ -775,7 +1130,7 @@ def write_org_index(org_groups, out_dir):
           </div>
         </div>
         <p class="subtle" style="margin-top:12px">
-          URL types: {url_types_count} · Latest report: <time>{html.escape(latest_created)}</time>
+          URL types: {url_types_count} · Latest report: <time>{_e(latest_created)}</time>
         </p>
       </li>
     """)
@@ -823,38 +1178,41 @@ def write_org_index(org_groups, out_dir):
   </script>
 </body></html>"""
 
-    with open(os.path.join(org_dir, "index.html"), "w", encoding="utf-8") as f:
-        f.write(html_page)
-
-def write_org_pages(org_groups, out_dir):
-    org_dir = os.path.join(out_dir, "organizations")
-    os.makedirs(org_dir, exist_ok=True)
+    write_file(os.path.join(org_dir, "index.html"), html_page.encode("utf-8"))
+
+def org_page_fields(group):
+    """Placeholder values shared by the organization page templates of both themes."""
+    summary = prepare_org_summary(group)
+    buf = io.StringIO(); w = buf.write
+    for label in summary["status_labels"]:
+        w("<th>"); w(_e(label)); w("</th>")
+    status_headers = buf.getvalue()
+    buf = io.StringIO(); w = buf.write
+    for row in summary["status_table_rows"]:
+        w("<tr><td>"); w(_e(row["label"])); w("</td><td>"); w(str(row["total"])); w("</td>")
+        for value in row["counts"]:
+            w("<td>"); w(str(value)); w("</td>")
+        w("</tr>")
+    status_rows = buf.getvalue() or '<tr><td colspan="99"><span class="badge na">No URL types</span></td></tr>'
+    return {
+        "name": _e(group["name"]),
+        "slug": _e(group["slug"]),
+        "total": group["total"],
+        "success": summary["success"],
+        "failure": summary["failure"],
+        "other": max(summary["other"], 0),
+        "url_types_count": summary["url_types_count"],
+        "latest": _e(summary["latest_created"]),
+        "status_headers": status_headers,
+        "status_rows": status_rows,
+        "status_data_json": summary["status_data_json"],
+        "url_chart_json": summary["url_chart_json"],
+    }
 
-    for group in org_groups:
-        summary = prepare_org_summary(group)
-        success = summary["success"]
-        failure = summary["failure"]
-        other = summary["other"]
-        url_types_count = summary["url_types_count"]
-        status_labels = summary["status_labels"]
-        status_data_json = summary["status_data_json"]
-        url_chart_json = summary["url_chart_json"]
-        status_table_headers = "".join(f"<th>{html.escape(label)}</th>" for label in status_labels)
-        status_table_rows = []
-        for row in summary["status_table_rows"]:
-            cells = "".join(f"<td>{value}</td>" for value in row["counts"])
-            status_table_rows.append(f"<tr><td>{html.escape(row['label'])}</td><td>{row['total']}</td>{cells}</tr>")
-        if not status_table_rows:
-            status_table_rows.append('<tr><td colspan="99"><span class="badge na">No URL types</span></td></tr>')
-
-        latest_created = summary["latest_created"]
-        report_rows = [render_report_row(it, "../reports") for it in group["items"]]
-        if not report_rows:
-            report_rows.append('<tr><td colspan="7"><span class="badge na">No reports found</span></td></tr>')
-
-        page_html = f"""<!doctype html><html lang="en"><head>
+# organization page, primary theme: head + render_report_data() + tail, filled per org
+_ORG_PAGE_HEAD = f"""<!doctype html><html lang="en"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
-<title>{html.escape(group['name'])} · Validation Reports</title>
+<title>%(name)s · Validation Reports</title>
 <link rel="stylesheet" href="../style.css">
 <script defer src="../app.js"></script>
 <script src="{CHART_JS_URL}"></script>
@@ -872,26 +1230,26 @@ def write_org_pages(org_groups, out_dir):
     </div>
 
     <div class="panel section">
-      <div class="h1" style="font-size:20px">{html.escape(group['name'])}</div>
+      <div class="h1" style="font-size:20px">%(name)s</div>
       <p class="subtle" style="margin-top:8px">
-        Total reports: {group['total']} · Success: {success} · Failure: {failure} · Other: {max(other, 0)} · URL types: {url_types_count} · Latest: <time>{html.escape(latest_created)}</time>
+        Total reports: %(total)s · Success: %(success)s · Failure: %(failure)s · Other: %(other)s · URL types: %(url_types_count)s · Latest: <time>%(latest)s</time>
       </p>
       <div class="summary-grid" style="margin-top:16px">
         <div class="summary-tile">
           <div class="label">Total reports</div>
-          <div class="value">{group['total']}</div>
+          <div class="value">%(total)s</div>
         </div>
         <div class="summary-tile">
           <div class="label">Success</div>
-          <div class="value" style="color:var(--good)">{success}</div>
+          <div class="value" style="color:var(--good)">%(success)s</div>
         </div>
         <div class="summary-tile">
           <div class="label">Failure</div>
-          <div class="value" style="color:var(--bad)">{failure}</div>
+          <div class="value" style="color:var(--bad)">%(failure)s</div>
         </div>
         <div class="summary-tile">
           <div class="label">URL types</div>
-          <div class="value">{url_types_count}</div>
+          <div class="value">%(url_types_count)s</div>
         </div>
       </div>
     </div>
@@ -915,11 +1273,11 @@ def write_org_pages(org_groups, out_dir):
             <tr>
               <th>URL type</th>
               <th>Total</th>
-              {status_table_headers}
+              %(status_headers)s
             </tr>
           </thead>
           <tbody>
-            {''.join(status_table_rows)}
+            %(status_rows)s
           </tbody>
         </table>
       </div>
@@ -989,11 +1347,12 @@ def write_org_pages(org_groups, out_dir):
               </th>
             </tr>
           </thead>
-          <tbody>
-            {''.join(report_rows)}
-          </tbody>
+          <tbody></tbody>
         </table>
       </div>
+      """
+
+_ORG_PAGE_TAIL = """
 
       <div class="pager">
         <span class="subtle" id="pager-info"></span>
@@ -1011,215 +1370,299 @@ def write_org_pages(org_groups, out_dir):
   </div>
 
   <script>
-    document.addEventListener('DOMContentLoaded', function(){{
+    document.addEventListener('DOMContentLoaded', function(){
       const tickColor = '#e8ecfa';
       const gridColor = 'rgba(255,255,255,0.1)';
-      const statusData = {status_data_json};
-      const urlTypeData = {url_chart_json};
-      if(window.Chart){{
+      const statusData = %(status_data_json)s;
+      const urlTypeData = %(url_chart_json)s;
+      if(window.Chart){
         const statusCanvas = document.getElementById('statusChart');
-        if(statusCanvas){{
-          new Chart(statusCanvas.getContext('2d'), {{
+        if(statusCanvas){
+          new Chart(statusCanvas.getContext('2d'), {
             type: 'pie',
             data: statusData,
-            options: {{
-              plugins: {{
-                legend: {{
+            options: {
+              plugins: {
+                legend: {
                   position: 'bottom',
-                  labels: {{ color: tickColor }}
-                }}
-              }}
-            }}
-          }});
-        }}
+                  labels: { color: tickColor }
+                }
+              }
+            }
+          });
+        }
         const urlCanvas = document.getElementById('urlTypeChart');
-        if(urlCanvas){{
-          new Chart(urlCanvas.getContext('2d'), {{
+        if(urlCanvas){
+          new Chart(urlCanvas.getContext('2d'), {
             type: 'bar',
             data: urlTypeData,
-            options: {{
-              plugins: {{
-                legend: {{
-                  labels: {{ color: tickColor }}
-                }}
-              }},
+            options: {
+              plugins: {
+                legend: {
+                  labels: { color: tickColor }
+                }
+              },
               responsive: true,
-              scales: {{
-                x: {{
+              scales: {
+                x: {
                   stacked: true,
-                  ticks: {{ color: tickColor }},
-                  grid: {{ color: gridColor }}
-                }},
-                y: {{
+                  ticks: { color: tickColor },
+                  grid: { color: gridColor }
+                },
+                y: {
                   stacked: true,
-                  ticks: {{ color: tickColor }},
-                  grid: {{ color: gridColor }},
+                  ticks: { color: tickColor },
+                  grid: { color: gridColor },
                   beginAtZero: true
-                }}
-              }}
-            }}
-          }});
-        }}
-      }}
-    }});
+                }
+              }
+            }
+          });
+        }
+      }
+    });
   </script>
 </body></html>"""
 
-        with open(os.path.join(org_dir, f"{group['slug']}.html"), "w", encoding="utf-8") as f:
-            f.write(page_html)
+def write_org_pages(org_groups, out_dir):
+    org_dir = os.path.join(out_dir, "organizations")
+    os.makedirs(org_dir, exist_ok=True)
+
+    for group in org_groups:
+        fields = org_page_fields(group)
+        write_file(os.path.join(org_dir, f"{group['slug']}.html"), (_ORG_PAGE_HEAD % fields).encode("utf-8"),
+                   render_report_data(group["items"], "../reports"), (_ORG_PAGE_TAIL % fields).encode("utf-8"))
 
 # --------------------- Detail pages (versioned) ---------------------
 
-def render_errors_table(errs, lang='en'):
+_ERR_ROW = "<tr><td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>"
+
+def render_errors_table(errs, lang='en', key='0'):
+    """First ERRORS_INLINE rows as HTML; the rest (up to ERRORS_MAX) ship as a JSON blob
+    that app.js's showAllErrors() appends on demand. `key` must be unique within the page."""
     if not errs:
         return '<p class="badge ok">No errors</p>' if lang=='en' else '<p class="badge ok">Aucune erreur</p>'
     head = '<thead><tr><th>Row</th><th>Field</th><th>Code</th><th>Message</th></tr></thead>' if lang=='en' \
          else '<thead><tr><th>Ligne</th><th>Champ</th><th>Code</th><th>Message</th></tr></thead>'
-    rows=''.join(
-        f"<tr><td>{html.escape(str(e.get('rowNumber','')))}</td>"
-        f"<td>{html.escape(str(e.get('fieldName','')))}</td>"
-        f"<td>{html.escape(str(e.get('code','')))}</td>"
-        f"<td>{html.escape(str(e.get('message','')))}</td></tr>"
-        for e in errs[:1000]
-    )
-    return f'<table class="table">{head}<tbody>{rows}</tbody></table>'
-
-# v0.2 tasks blocks
-def render_task_block(task, lang='en', idx=0):
-    st=task.get("stats") or {}
-    labels=task.get("labels") or []
-    warns =task.get("warnings") or []
-    errs  =task.get("errors") or []
-    name  =task.get("name") or f"Task {idx+1}"
-    ttype =task.get("type") or ""
-    place =task.get("place") or ""
-
-    kv=[]
-    kv.append(f"<div>Valid</div><div>{badge_state(task.get('valid'))}</div>")
-    for label,key in [("Type","type"),("Source","place"),("Rows","rows"),("Fields","fields"),("Errors","errors"),
-                      ("Warnings","warnings"),("Bytes","bytes"),("MD5","md5"),("SHA256","sha256"),("Seconds","seconds")]:
-        val = st.get(key) if key in ("rows","fields","errors","warnings","bytes","md5","sha256","seconds") else task.get(key)
-        if val not in (None,"",[]):
-            if key=="place":
-                val = f'<a href="{html.escape(str(val))}" target="_blank" rel="noopener">{html.escape(str(val))}</a>'
-            kv.append(f"<div>{label}</div><div>{val}</div>")
-
-    labels_html="<br/>".join(html.escape(str(x)) for x in labels) if labels else '<span class="subtle">(none)</span>'
-    warns_html ="<br/>".join(html.escape(str(x)) for x in warns)  if warns  else '<span class="subtle">(none)</span>'
-    errs_html  ="<br/>".join(html.escape(str(x)) for x in errs)   if errs   else '<span class="subtle">(none)</span>'
-    raw_json   = html.escape(json.dumps(task, ensure_ascii=False, indent=2))
-
-    return f"""
+    buf = io.StringIO(); w = buf.write; esc = _t; row = _ERR_ROW
+    w(f'<table class="table" id="errs-{key}">{head}<tbody>')
+    for e in islice(errs, ERRORS_INLINE):
+        get = e.get
+        w(row % (esc(str(get('rowNumber',''))), esc(str(get('fieldName',''))),
+                 esc(str(get('code',''))), esc(str(get('message','')))))
+    w('</tbody></table>')
+    table = buf.getvalue()
+    rest = errs[ERRORS_INLINE:ERRORS_MAX]
+    if not rest:
+        return table
+    cells = [[str(e.get('rowNumber','')), str(e.get('fieldName','')), str(e.get('code','')), str(e.get('message',''))]
+             for e in rest]
+    blob = script_json(cells)
+    label = f"Show all {len(errs[:ERRORS_MAX])} errors" if lang=='en' else f"Afficher les {len(errs[:ERRORS_MAX])} erreurs"
+    return (f'{table}<script type="application/json" id="errs-{key}-rest">{blob}</script>'
+            f'<p><button type="button" class="btn" data-errs="errs-{key}" onclick="showAllErrors(this)">{label}</button></p>')
+
+# v0.2 tasks blocks: head, then the kv cells written one by one, then the tail
+_TASK_HEAD = """
     <div class="section">
-      <div class="h1" style="font-size:16px">{html.escape(name)} {chip(ttype, 'na')}</div>
-      <div class="kv" style="margin-top:8px">{''.join(kv)}</div>
-      <h4 style="margin:12px 0 6px">{'Labels' if lang=='en' else 'Étiquettes'}</h4><div class="code">{labels_html}</div>
-      <h4 style="margin:12px 0 6px">{'Warnings' if lang=='en' else 'Avertissements'}</h4><div class="code">{warns_html}</div>
-      <h4 style="margin:12px 0 6px">{'Errors' if lang=='en' else 'Erreurs'}</h4><div class="code">{errs_html}</div>
-      <h4 style="margin:12px 0 6px">{'Raw task JSON' if lang=='en' else 'JSON brut de la tâche'}</h4><div class="code">{raw_json}</div>
-    </div>"""
-
-def render_lang_panel_v02(lang, tasks):
-    a=agg_v02(tasks) if tasks is not None else {"valid_all":None,"error_count":0,"warning_count":0,"row_count":0}
-    head=f"""
+      <div class="h1" style="font-size:16px">%s %s</div>
+      <div class="kv" style="margin-top:8px">"""
+_TASK_TAIL = {lang: """</div>
+      <h4 style="margin:12px 0 6px">%s</h4><div class="code">%%s</div>
+      <h4 style="margin:12px 0 6px">%s</h4><div class="code">%%s</div>
+      <h4 style="margin:12px 0 6px">%s</h4><div class="code">%%s</div>
+    </div>""" % labels for lang, labels in (("en", ("Labels", "Warnings", "Errors")),
+                                            ("fr", ("Étiquettes", "Avertissements", "Erreurs")))}
+
+# kv rows of a task block, in display order; the second group reads from task["stats"]
+_TASK_STATS_KV = (("Rows","rows"),("Fields","fields"),("Errors","errors"),("Warnings","warnings"),
+                  ("Bytes","bytes"),("MD5","md5"),("SHA256","sha256"),("Seconds","seconds"))
+_NONE_HTML = '<span class="subtle">(none)</span>'
+
+def render_task_block(w, task, lang='en', idx=0):
+    """Write one task's section to `w`, the page buffer's write."""
+    get=task.get
+    st=get("stats") or _EMPTY
+    labels=get("labels") or []
+    warns =get("warnings") or []
+    errs  =get("errors") or []
+    name  =get("name") or f"Task {idx+1}"
+    ttype =get("type") or ""
+
+    w(_TASK_HEAD % (_t(name), chip(ttype, 'na')))
+    w("<div>Valid</div><div>"); w(badge_state(get('valid'))); w("</div>")
+    # a field is shown unless it is None, "" or []; spelled out because `in (None,"",[])`
+    # builds a fresh list and tuple on every test
+    val=get("type")
+    if val is not None and val != "" and val != []:
+        w("<div>Type</div><div>"); w(_t(str(val))); w("</div>")
+    val=get("place")
+    if val is not None and val != "" and val != []:
+        val = _e(str(val))
+        w('<div>Source</div><div><a href="'); w(val); w('" target="_blank" rel="noopener">'); w(val); w("</a></div>")
+    sget=st.get
+    for label,key in _TASK_STATS_KV:
+        val=sget(key)
+        if val is not None and val != "" and val != []:
+            w("<div>"); w(label); w("</div><div>"); w(_t(str(val))); w("</div>")
+
+    labels_html="<br/>".join(map(_t, map(str, labels))) if labels else _NONE_HTML
+    warns_html ="<br/>".join(map(_t, map(str, warns)))  if warns  else _NONE_HTML
+    errs_html  ="<br/>".join(map(_t, map(str, errs)))   if errs   else _NONE_HTML
+
+    w(_TASK_TAIL[lang] % (labels_html, warns_html, errs_html))
+
+def raw_json_link(lang, raw_href):
+    if not raw_href:
+        return ""
+    label = "Raw report JSON" if lang=='en' else "JSON brut du rapport"
+    return f'<p style="margin:12px 0 0"><a class="btn" href="{_e(raw_href)}" target="_blank" rel="noopener">{label}</a></p>'
+
+# panel shells shared by both report versions; the EN panel is shown first
+_PANEL_OPEN = {"en": '<section data-lang="en"  class="panel">',
+               "fr": '<section data-lang="fr" style="display:none" class="panel">'}
+_PANEL_HEAD_V02 = {lang: """
       <div class="section">
         <div class="kv">
-          <div>{"Valid" if lang=='en' else "Valide"}</div><div>{badge_state(a["valid_all"])}</div>
-          <div>{"Errors" if lang=='en' else "Erreurs"}</div><div>{a["error_count"]}</div>
-          <div>{"Warnings" if lang=='en' else "Avertissements"}</div><div>{a["warning_count"]}</div>
-          <div>{"Rows" if lang=='en' else "Lignes"}</div><div>{a["row_count"]}</div>
-        </div>
-      </div>"""
-    blocks="".join(render_task_block(t,lang,i) for i,t in enumerate(tasks or [])) or \
-        ('<div class="section"><span class="badge na">No tasks</span></div>' if lang=='en' else '<div class="section"><span class="badge na">Aucune tâche</span></div>')
-    style='' if lang=='en' else 'style="display:none"'
-    return f'<section data-lang="{lang}" {style} class="panel">{head}{blocks}</section>'
-
-# v0.1 tables blocks
-def render_table_block_v01(t, lang='en', idx=0):
-    headers=t.get("headers",[])
-    header_text=html.escape("\n".join(map(str,headers))) if headers else '<span class="subtle">(none)</span>'
-    kv=[]
-    for label,key in [("Valid","valid"),("Format","format"),("Encoding","encoding"),("Scheme","scheme"),
-                      ("Source","source"),("Time","time"),("Row count","row-count"),("Row count","row_count"),
-                      ("Error count","error-count"),("Error count","error_count")]:
-        val=t.get(key)
-        if label in ("Row count","Error count") and val is None:
-            alt = key.replace("-","_") if "-" in key else key.replace("_","-")
-            val=t.get(alt)
-        if val not in (None,"",[]):
-            if key=="valid": val=badge_state(bool(val))
-            kv.append(f"<div>{label}</div><div>{html.escape(str(val))}</div>")
-    errors_table=render_errors_table(t.get("errors",[]),lang)
-    raw_json=html.escape(json.dumps(t, ensure_ascii=False, indent=2))
-    return f"""
+          <div>%s</div><div>%%s</div>
+          <div>%s</div><div>%%s</div>
+          <div>%s</div><div>%%s</div>
+          <div>%s</div><div>%%s</div>
+        </div>%%s
+      </div>""" % labels for lang, labels in (("en", ("Valid", "Errors", "Warnings", "Rows")),
+                                              ("fr", ("Valide", "Erreurs", "Avertissements", "Lignes")))}
+_NO_TASKS = {"en": '<div class="section"><span class="badge na">No tasks</span></div>',
+             "fr": '<div class="section"><span class="badge na">Aucune tâche</span></div>'}
+
+def render_lang_panel_v02(w, lang, tasks, a, raw_href=None):
+    """Write the `lang` panel to `w`, the page buffer's write; `a` is the item's aggregate for
+    `lang` (errors/rows/valid/warnings), computed once at load."""
+    w(_PANEL_OPEN[lang])
+    w(_PANEL_HEAD_V02[lang] % (badge_state(a["valid"]), a["errors"], a["warnings"], a["rows"],
+                               raw_json_link(lang, raw_href)))
+    if tasks:
+        for i,t in enumerate(tasks):
+            render_task_block(w,t,lang,i)
+    else:
+        w(_NO_TASKS[lang])
+    w('</section>')
+
+# v0.1 tables blocks, split around the kv cells like the task blocks
+_TABLE_HEAD = """
       <div class="section">
-        <div class="h1" style="font-size:16px">Table {idx+1}</div>
-        <div class="kv" style="margin-top:8px">{''.join(kv) or '<div>Table</div><div>-</div>'}</div>
-        <h4 style="margin:12px 0 6px">{'Errors' if lang=='en' else 'Erreurs'}</h4>{errors_table}
-        <h4 style="margin:12px 0 6px">{'Headers' if lang=='en' else 'En-têtes'}</h4><div class="code">{header_text}</div>
-        <h4 style="margin:12px 0 6px">{'Raw table JSON' if lang=='en' else 'JSON brut de la table'}</h4><div class="code">{raw_json}</div>
-      </div>"""
-
-def render_lang_panel_v01(lang, tables):
-    a=agg_v01(tables) if tables is not None else {"valid_all":None,"error_count":0,"row_count":0}
-    head=f"""
+        <div class="h1" style="font-size:16px">Table %d</div>
+        <div class="kv" style="margin-top:8px">"""
+_TABLE_TAIL = {lang: """</div>
+        <h4 style="margin:12px 0 6px">%s</h4>%%s
+        <h4 style="margin:12px 0 6px">%s</h4><div class="code">%%s</div>
+      </div>""" % labels for lang, labels in (("en", ("Errors", "Headers")), ("fr", ("Erreurs", "En-têtes")))}
+
+_TABLE_KV = (("Format","format"),("Encoding","encoding"),("Scheme","scheme"),("Source","source"),
+             ("Time","time"),("Row count","row_count"),("Error count","error_count"))
+
+def render_table_block_v01(w, t, lang='en', idx=0):
+    """Write one table's section to `w`, the page buffer's write."""
+    get=t.get
+    headers=get("headers",[])
+    header_text=_t("\n".join(map(str,headers))) if headers else _NONE_HTML
+    w(_TABLE_HEAD % (idx+1))
+    empty=True
+    val=get("valid")
+    if val is not None and val != "" and val != []:
+        w("<div>Valid</div><div>"); w(badge_state(bool(val))); w("</div>")
+        empty=False
+    # count keys were normalized to their underscore spelling at load (normalize_tables_v01)
+    for label,key in _TABLE_KV:
+        val=get(key)
+        if val is not None and val != "" and val != []:
+            w("<div>"); w(label); w("</div><div>"); w(_t(str(val))); w("</div>")
+            empty=False
+    if empty:
+        w("<div>Table</div><div>-</div>")
+    w(_TABLE_TAIL[lang] % (render_errors_table(get("errors",[]),lang,f"{lang}-{idx}"), header_text))
+
+_PANEL_HEAD_V01 = {lang: """
       <div class="section">
         <div class="kv">
-          <div>{"Valid" if lang=='en' else "Valide"}</div><div>{badge_state(a["valid_all"])}</div>
-          <div>{"Errors" if lang=='en' else "Erreurs"}</div><div>{a["error_count"]}</div>
-          <div>{"Rows" if lang=='en' else "Lignes"}</div><div>{a["row_count"]}</div>
-        </div>
-      </div>"""
-    blocks="".join(render_table_block_v01(t,lang,i) for i,t in enumerate(tables or [])) or \
-        ('<div class="section"><span class="badge na">No tables</span></div>' if lang=='en' else '<div class="section"><span class="badge na">Aucune table</span></div>')
-    style='' if lang=='en' else 'style="display:none"'
-    return f'<section data-lang="{lang}" {style} class="panel">{head}{blocks}</section>'
-
-def write_report_pages(items, out_dir, org_lookup=None):
-    rdir=os.path.join(out_dir,"reports"); os.makedirs(rdir, exist_ok=True)
-    for it in items:
-        pid=slugify(it['id']); ver=it.get("version") or "unknown"
-
-        # Dataset links (edit + portal)
-        dsid = it.get('dataset_id','')
-        edit_url   = f"https://registry.open.canada.ca/dataset/{html.escape(dsid)}"
-        portal_url = f"https://open.canada.ca/data/en/dataset/{html.escape(dsid)}"
-        dataset_links = f'''
+          <div>%s</div><div>%%s</div>
+          <div>%s</div><div>%%s</div>
+          <div>%s</div><div>%%s</div>
+        </div>%%s
+      </div>""" % labels for lang, labels in (("en", ("Valid", "Errors", "Rows")),
+                                              ("fr", ("Valide", "Erreurs", "Lignes")))}
+_NO_TABLES = {"en": '<div class="section"><span class="badge na">No tables</span></div>',
+              "fr": '<div class="section"><span class="badge na">Aucune table</span></div>'}
+
+def render_lang_panel_v01(w, lang, tables, a, raw_href=None):
+    """v0.1 counterpart of render_lang_panel_v02(); writes to `w` as well."""
+    w(_PANEL_OPEN[lang])
+    w(_PANEL_HEAD_V01[lang] % (badge_state(a["valid"]), a["errors"], a["rows"], raw_json_link(lang, raw_href)))
+    if tables:
+        for i,t in enumerate(tables):
+            render_table_block_v01(w,t,lang,i)
+    else:
+        w(_NO_TABLES[lang])
+    w('</section>')
+
+_META_TMPL = """
+        <div class="kv" style="margin-top:%(margin)dpx">
+          <div>Version</div><div>%(version)s</div>
+          <div>Organization</div><div>%(org)s</div>
+          <div>Dataset</div><div>%(dataset_html)s <span class="small"><code>%(dataset_id)s</code></span>
           <div>
-            <a class="badge link" href="{edit_url}" target="_blank" rel="noopener">edit</a>
+            <a class="badge link" href="https://registry.open.canada.ca/dataset/%(dataset_q)s" target="_blank" rel="noopener">edit</a>
             &nbsp;
-            <a class="badge link" href="{portal_url}" target="_blank" rel="noopener">portal</a>
+            <a class="badge link" href="https://open.canada.ca/data/en/dataset/%(dataset_q)s" target="_blank" rel="noopener">portal</a>
           </div>
-        '''
-
-        org_name = normalize_org_name(it.get('organization_name'))
-        org_slug = (org_lookup or {}).get(org_name)
-        if org_slug:
-            org_cell = f'<a href="../organizations/{html.escape(org_slug)}.html">{html.escape(org_name)}</a>'
-        else:
-            org_cell = html.escape(org_name)
-
-        header_meta=f"""
-        <div class="kv" style="margin-top:8px">
-          <div>Version</div><div>{chip(ver,'na')}</div>
-          <div>Organization</div><div>{org_cell}</div>
-          <div>Dataset</div><div>{lang_html(it.get('dataset_title_en',''), it.get('dataset_title_fr',''))} <span class="small"><code>{html.escape(dsid)}</code></span>{dataset_links}</div>
-          <div>Resource</div><div>{lang_html(it.get('resource_name_en',''), it.get('resource_name_fr',''))} <span class="small"><code>{html.escape(it.get('resource_id',''))}</code> · {html.escape(it.get('url_type',''))}</span></div>
-          <div>Status</div><div>{chip(it['status'] or 'unknown', 'na' if it['status'] not in ('success','failure') else ('ok' if it['status']=='success' else 'bad'))}</div>
-          <div>Created</div><div><time>{html.escape(it['created'] or '')}</time></div>
+        </div>
+          <div>Resource</div><div>%(resource_html)s <span class="small"><code>%(resource_id)s</code> · %(url_type)s</span></div>
+          <div>Status</div><div>%(status)s</div>
+          <div>Created</div><div><time>%(created)s</time></div>
         </div>"""
 
-        if ver=="v0.2":
-            body=f"{render_lang_panel_v02('en', it['lang_data'].get('en'))}{render_lang_panel_v02('fr', it['lang_data'].get('fr'))}"
-        elif ver=="v0.1":
-            body=f"{render_lang_panel_v01('en', it['lang_data'].get('en'))}{render_lang_panel_v01('fr', it['lang_data'].get('fr'))}"
-        else:
-            body='<div class="panel section"><span class="badge na">Unknown report format</span></div>'
+@lru_cache(maxsize=None)
+def _org_cell(org_name, org_slug, org_dir):
+    """Organization link (or plain name) for a report page: one per org and theme, not per report."""
+    if org_slug:
+        return f'<a href="../{org_dir}/{_e(org_slug)}.html">{_e(org_name)}</a>'
+    return _t(org_name)
+
+def render_report_meta(it, org_lookup=None, org_dir="organizations", margin=8):
+    """Version/organization/dataset/resource summary shown at the top of a report page."""
+    dsid = it.get('dataset_id','')
+    org_name = normalize_org_name(it.get('organization_name'))
+    status = it['status']
+    return _META_TMPL % {
+        "margin": margin,
+        "version": _chip_shared(it.get("version") or "unknown", 'na'),
+        "org": _org_cell(org_name, (org_lookup or _EMPTY).get(org_name), org_dir),
+        "dataset_html": it['dataset_html'], "dataset_id": _t(dsid), "dataset_q": _e(dsid),
+        "resource_html": it['resource_html'], "resource_id": _t(it.get('resource_id','')),
+        "url_type": _t_shared(it.get('url_type','')),
+        "status": _chip_shared(status or 'unknown', _STATUS_CLS.get(status, 'na')),
+        "created": _t(it['created'] or ''),
+    }
 
-        page=f"""<!doctype html><html lang="en"><head>
+RAW_DIR = "raw"
+
+def render_report_body(it):
+    """EN/FR panels for a report; identical for both themes, so rendered once per item."""
+    ver=it.get("version") or "unknown"
+    if ver=="v0.2":
+        render_panel=render_lang_panel_v02
+    elif ver=="v0.1":
+        render_panel=render_lang_panel_v01
+    else:
+        return '<div class="panel section"><span class="badge na">Unknown report format</span></div>'
+    buf=io.StringIO(); w=buf.write
+    lang_data=it['lang_data']; raw_href=f"../{RAW_DIR}/{it['slug']}.json"
+    for lang in ("en","fr"):
+        render_panel(w, lang, lang_data.get(lang), it[lang], raw_href)
+    return buf.getvalue()
+
+_PAGE_HEAD = """<!doctype html><html lang="en"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
-<title>Report {html.escape(it['id'])}</title>
+<title>Report %(id)s</title>
 <link rel="stylesheet" href="../style.css"><script defer src="../app.js"></script>
 </head><body>
   <div class="container">
@@ -1232,15 +1675,103 @@ def write_report_pages(items, out_dir, org_lookup=None):
     </div>
 
     <div class="panel section">
-      <div class="h1" style="font-size:18px"><code>{html.escape(it['id'])}</code></div>
-      {header_meta}
+      <div class="h1" style="font-size:18px"><code>%(id)s</code></div>
+      %(meta)s
     </div>
 
-    {body}
+    """
+
+_PAGE_TAIL = """
   </div>
-</body></html>"""
-        with open(os.path.join(rdir, f"{pid}.html"), "w", encoding="utf-8") as f:
-            f.write(page)
+</body></html>""".encode("utf-8")
+
+def render_report_head(it, org_lookup=None):
+    """Everything before the shared report body; the page is head + body + _PAGE_TAIL."""
+    return _PAGE_HEAD % {"id": _e(it['id']), "meta": render_report_meta(it, org_lookup)}
+
+def build_key(primary, gcds):
+    """Folded into every page digest: the builder's own source (templates, CSS, JS and
+    limits all live in it) plus the settings that change what a report's files contain."""
+    with open(__file__, "rb") as f:
+        h = hashlib.blake2b(f.read(), digest_size=16)
+    h.update(repr((primary, gcds, SITE_GZIP)).encode())
+    return h.digest()
+
+# files write_file() produces per output path, all of which must exist for a page to be skipped
+_GZ_SUFFIXES = ("", ".gz") if SITE_GZIP else ("",)
+
+_DIGEST_SKIP = ("raw", "lang_data")    # lang_data is derived from raw, which is hashed as is
+
+def page_digest(it, org_lookup, key):
+    """Hex digest of everything a report's pages are rendered from."""
+    h = hashlib.blake2b(key, digest_size=16)
+    h.update(orjson.dumps({k: v for k, v in it.items() if k not in _DIGEST_SKIP}))
+    raw = it["raw"]
+    h.update(raw.encode("utf-8") if type(raw) is str else orjson.dumps(raw, option=orjson.OPT_NON_STR_KEYS))
+    # the org link on the page depends on the org's slug, which other reports can change
+    slug = (org_lookup or _EMPTY).get(normalize_org_name(it["organization_name"])) or ""
+    h.update(slug.encode("utf-8"))
+    return h.hexdigest()
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def _write_report_page(it, primary_prefix=None, gcds_prefix=None, raw_prefix=None, org_lookup=None,
+                       digest_key=None, manifest=None):
+    """Write a report's raw JSON and theme pages. With a digest_key (SITE_INCREMENTAL) returns
+    `(slug, digest)` and skips the writes when `manifest` holds the same digest and the files
+    (and, with SITE_GZIP, their .gz copies) exist."""
+    pid=it['slug']
+    if digest_key is not None:
+        digest = page_digest(it, org_lookup, digest_key)
+        if manifest.get(pid) == digest and all(
+                os.path.exists(prefix + pid + ext + gz)
+                for prefix, ext in ((primary_prefix, ".html"), (gcds_prefix, ".html"), (raw_prefix, ".json"))
+                if prefix and (ext == ".html" or it.get("version") in ("v0.2", "v0.1"))
+                for gz in _GZ_SUFFIXES):
+            return pid, digest
+    # encoded once, shared by both themes; each page goes out as head/body/tail in one writev
+    body=render_report_body(it).encode("utf-8")
+    # raw JSON lives in a side file the browser only fetches on click, not inline in every page;
+    # payloads that arrived as JSON text are written back verbatim, with no re-serialization
+    if raw_prefix and it.get("version") in ("v0.2", "v0.1"):
+        raw=it['raw']
+        write_file(raw_prefix + pid + ".json", raw.encode("utf-8") if type(raw) is str else pretty_json(raw))
+    if primary_prefix:
+        write_file(primary_prefix + pid + ".html",
+                   render_report_head(it, org_lookup).encode("utf-8"), body, _PAGE_TAIL)
+    if gcds_prefix:
+        write_file(gcds_prefix + pid + ".html",
+                   render_gcds_report_head(it, org_lookup).encode("utf-8"), body, _GC_PAGE_TAIL)
+    if digest_key is not None:
+        return pid, digest
+
+def write_report_pages(jsonl_path, out_dir, org_lookup=None, primary=True, gcds=False):
+    """Detail pages for both themes in a single streamed pass over the JSONL at `jsonl_path`."""
+    primary_prefix = gcds_prefix = None
+    if primary:
+        rdir=os.path.join(out_dir,"reports"); os.makedirs(rdir, exist_ok=True)
+        primary_prefix = rdir + os.sep
+    if gcds:
+        gc_reports_dir = os.path.join(out_dir, "gc_reports"); os.makedirs(gc_reports_dir, exist_ok=True)
+        gcds_prefix = gc_reports_dir + os.sep
+    raw_prefix = None
+    if primary or gcds:
+        raw_dir = os.path.join(out_dir, RAW_DIR); os.makedirs(raw_dir, exist_ok=True)
+        raw_prefix = raw_dir + os.sep
+    digest_key = manifest = None
+    if SITE_INCREMENTAL:
+        digest_key = build_key(primary, gcds)
+        manifest = load_manifest(out_dir)
+    done = map_jsonl(partial(_write_report_page, primary_prefix=primary_prefix, gcds_prefix=gcds_prefix,
+                             raw_prefix=raw_prefix, org_lookup=org_lookup,
+                             digest_key=digest_key, manifest=manifest), jsonl_path)
+    if SITE_INCREMENTAL:
+        _write_bytes(os.path.join(out_dir, MANIFEST_NAME), orjson.dumps(dict(done)))
 
 
 
@@ -1328,10 +1859,13 @@ def write_gcds_index(items, org_groups, out_dir):
     """Write the improved GCDS main index page using latest GCDS styles/components with feature parity."""
 
     today = datetime.utcnow().strftime("%Y-%m-%d")
-    rows = [render_report_row(it, "gc_reports") for it in items]
     total_reports = len(items)
-    success_count = sum(1 for it in items if normalize_status(it.get("status")) == "success")
-    failure_count = sum(1 for it in items if normalize_status(it.get("status")) == "failure")
+    # every item sits in exactly one org group, whose status counts are already normalized
+    status_counts = Counter()
+    for group in org_groups:
+        status_counts.update(group["status_counts"])
+    success_count = status_counts["success"]
+    failure_count = status_counts["failure"]
     other_count = total_reports - success_count - failure_count
     org_count = len(org_groups)
 
@@ -1347,6 +1881,7 @@ def write_gcds_index(items, org_groups, out_dir):
   <link rel="stylesheet" href="gc_style.css" />
   <script type="module" src="{GCDS_COMPONENTS_JS}"></script>
   <script defer src="app.js"></script>
+  <link rel="preload" href="gc_index.json" as="fetch" crossorigin="anonymous" />
 </head>
 <body>
   <gcds-header service-title="Validation Portal" service-href="gc_index.html" skip-to-href="#main-content"></gcds-header>
@@ -1410,7 +1945,7 @@ def write_gcds_index(items, org_groups, out_dir):
         </div>
 
         <div class="table-wrap">
-          <table class="table" data-report-table>
+          <table class="table" data-report-table data-src="gc_index.json">
             <thead>
               <tr>
                 <th>ID</th>
@@ -1452,9 +1987,7 @@ def write_gcds_index(items, org_groups, out_dir):
                 </th>
               </tr>
             </thead>
-            <tbody>
-              {''.join(rows)}
-            </tbody>
+            <tbody></tbody>
           </table>
         </div>
 
@@ -1482,58 +2015,16 @@ def write_gcds_index(items, org_groups, out_dir):
 </body>
 </html>
 """
-    with open(os.path.join(out_dir, "gc_index.html"), "w", encoding="utf-8") as f:
-        f.write(html_code)
+    write_file(os.path.join(out_dir, "gc_index.json"), report_records_json(items, "gc_reports"))
+    write_file(os.path.join(out_dir, "gc_index.html"), html_code.encode("utf-8"))
 
-def write_gcds_report_pages(items, out_dir, org_lookup=None):
-    gc_reports_dir = os.path.join(out_dir, "gc_reports")
-    os.makedirs(gc_reports_dir, exist_ok=True)
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    for it in items:
-        pid = slugify(it['id'])
-        ver = it.get("version") or "unknown"
-        dsid = it.get('dataset_id','')
-        edit_url   = f"https://registry.open.canada.ca/dataset/{html.escape(dsid)}"
-        portal_url = f"https://open.canada.ca/data/en/dataset/{html.escape(dsid)}"
-        dataset_links = f'''
-          <div>
-            <a class="badge link" href="{edit_url}" target="_blank" rel="noopener">edit</a>
-            &nbsp;
-            <a class="badge link" href="{portal_url}" target="_blank" rel="noopener">portal</a>
-          </div>
-        '''
-
-        org_name = normalize_org_name(it.get('organization_name'))
-        org_slug = (org_lookup or {}).get(org_name)
-        if org_slug:
-            org_cell = f'<a href="../gc_organizations/{html.escape(org_slug)}.html">{html.escape(org_name)}</a>'
-        else:
-            org_cell = html.escape(org_name)
-
-        header_meta=f"""
-        <div class="kv" style="margin-top:12px">
-          <div>Version</div><div>{chip(ver,'na')}</div>
-          <div>Organization</div><div>{org_cell}</div>
-          <div>Dataset</div><div>{lang_html(it.get('dataset_title_en',''), it.get('dataset_title_fr',''))} <span class="small"><code>{html.escape(dsid)}</code></span>{dataset_links}</div>
-          <div>Resource</div><div>{lang_html(it.get('resource_name_en',''), it.get('resource_name_fr',''))} <span class="small"><code>{html.escape(it.get('resource_id',''))}</code> · {html.escape(it.get('url_type',''))}</span></div>
-          <div>Status</div><div>{chip(it['status'] or 'unknown', 'na' if it['status'] not in ('success','failure') else ('ok' if it['status']=='success' else 'bad'))}</div>
-          <div>Created</div><div><time>{html.escape(it.get('created') or '')}</time></div>
-        </div>"""
-
-        if ver=="v0.2":
-            body=f"{render_lang_panel_v02('en', it['lang_data'].get('en'))}{render_lang_panel_v02('fr', it['lang_data'].get('fr'))}"
-        elif ver=="v0.1":
-            body=f"{render_lang_panel_v01('en', it['lang_data'].get('en'))}{render_lang_panel_v01('fr', it['lang_data'].get('fr'))}"
-        else:
-            body='<div class="panel section"><span class="badge na">Unknown report format</span></div>'
-
-        report_html = f"""<!DOCTYPE html>
+_GC_PAGE_HEAD = f"""<!DOCTYPE html>
 <html lang="en" dir="ltr">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-  <meta name="description" content="Validation Report for {html.escape(it['id'])}" />
-  <title>Validation Report {html.escape(it['id'])} – GCDS</title>
+  <meta name="description" content="Validation Report for %(id)s" />
+  <title>Validation Report %(id)s – GCDS</title>
   <link rel="stylesheet" href="{GCDS_CSS_SHORTCUTS}" />
   <link rel="stylesheet" href="{GCDS_COMPONENTS_CSS}" />
   <link rel="stylesheet" href="../gc_style.css" />
@@ -1546,30 +2037,37 @@ def write_gcds_report_pages(items, out_dir, org_lookup=None):
     <gcds-container id="main-content" main-container size="xl" centered tag="main">
       <section class="panel section">
         <div class="actions" style="justify-content:space-between">
-          <div class="h1"><code>{html.escape(it['id'])}</code></div>
+          <div class="h1"><code>%(id)s</code></div>
           <div class="actions">
             <a class="btn secondary" href="../gc_index.html">Back to index</a>
-            <a class="btn secondary" href="../reports/{html.escape(pid)}.html">Primary view</a>
+            <a class="btn secondary" href="../reports/%(slug)s.html">Primary view</a>
             <div class="lang-toggle">
               <button type="button" class="btn" data-set="en" onclick="setLang('en')">EN</button>
               <button type="button" class="btn" data-set="fr" onclick="setLang('fr')">FR</button>
             </div>
           </div>
         </div>
-        {header_meta}
+        %(meta)s
       </section>
 
-      {body}
+      """
 
-      <gcds-date-modified>{today}</gcds-date-modified>
+# the date is filled in by app.js (BUILD_DATE): a report page's bytes never depend on the
+# build date, so one left in place by SITE_INCREMENTAL still shows the current build's
+_GC_PAGE_TAIL = """
+
+      <gcds-date-modified data-build-date></gcds-date-modified>
     </gcds-container>
   </div>
   <gcds-footer display="full" contextual-heading="Canadian Digital Service"></gcds-footer>
 </body>
 </html>
-"""
-        with open(os.path.join(gc_reports_dir, f"{pid}.html"), "w", encoding="utf-8") as f:
-            f.write(report_html)
+""".encode("utf-8")
+
+def render_gcds_report_head(it, org_lookup=None):
+    """GCDS counterpart of render_report_head(); the page ends with `_GC_PAGE_TAIL`."""
+    return _GC_PAGE_HEAD % {"id": _e(it['id']), "slug": _e(it['slug']),
+                            "meta": render_report_meta(it, org_lookup, "gc_organizations", 12)}
 
 def write_gcds_org_index(org_groups, out_dir):
     org_dir = os.path.join(out_dir, "gc_organizations")
@@ -1581,10 +2079,10 @@ def write_gcds_org_index(org_groups, out_dir):
         summary = prepare_org_summary(group)
         match = f"{group['name']} {summary['success']} {summary['failure']} {summary['other']} {summary['url_types_count']}".lower()
         items_html.append(f"""
-      <li class="panel section" data-match="{html.escape(match)}">
+      <li class="panel section" data-match="{_e(match)}">
         <div class="actions" style="justify-content:space-between">
-          <div class="h1" style="font-size:20px">{html.escape(group['name'])}</div>
-          <a class="btn secondary" href="{html.escape(group['slug'])}.html">Open report</a>
+          <div class="h1" style="font-size:20px">{_e(group['name'])}</div>
+          <a class="btn secondary" href="{_e(group['slug'])}.html">Open report</a>
         </div>
         <div class="summary-grid">
           <div class="summary-tile">
@@ -1605,7 +2103,7 @@ def write_gcds_org_index(org_groups, out_dir):
           </div>
         </div>
         <p class="subtle" style="margin-top:12px">
-          URL types: {summary['url_types_count']} · Latest report: <time>{html.escape(summary['latest_created'])}</time>
+          URL types: {summary['url_types_count']} · Latest report: <time>{_e(summary['latest_created'])}</time>
         </p>
       </li>
     """)
@@ -1674,40 +2172,16 @@ def write_gcds_org_index(org_groups, out_dir):
 </html>
 """
 
-    with open(os.path.join(org_dir, "index.html"), "w", encoding="utf-8") as f:
-        f.write(html_page)
+    write_file(os.path.join(org_dir, "index.html"), html_page.encode("utf-8"))
 
-def write_gcds_org_pages(org_groups, out_dir):
-    org_dir = os.path.join(out_dir, "gc_organizations")
-    os.makedirs(org_dir, exist_ok=True)
-
-    for group in org_groups:
-        summary = prepare_org_summary(group)
-        status_table_headers = "".join(f"<th>{html.escape(label)}</th>" for label in summary["status_labels"])
-        status_table_rows = []
-        for row in summary["status_table_rows"]:
-            cells = "".join(f"<td>{value}</td>" for value in row["counts"])
-            status_table_rows.append(f"<tr><td>{html.escape(row['label'])}</td><td>{row['total']}</td>{cells}</tr>")
-        if not status_table_rows:
-            status_table_rows.append('<tr><td colspan="99"><span class="badge na">No URL types</span></td></tr>')
-
-        report_rows = [render_report_row(it, "../gc_reports") for it in group["items"]]
-        if not report_rows:
-            report_rows.append('<tr><td colspan="7"><span class="badge na">No reports found</span></td></tr>')
-
-        success = summary["success"]
-        failure = summary["failure"]
-        other = summary["other"]
-        url_types_count = summary["url_types_count"]
-        latest_created = summary["latest_created"]
-
-        page_html = f"""<!DOCTYPE html>
+# organization page, GCDS theme; same layout as _ORG_PAGE_HEAD/_ORG_PAGE_TAIL
+_GC_ORG_PAGE_HEAD = f"""<!DOCTYPE html>
 <html lang="en" dir="ltr">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-  <meta name="description" content="Organization validation reports for {html.escape(group['name'])} (GCDS theme)." />
-  <title>{html.escape(group['name'])} · GCDS Validation Reports</title>
+  <meta name="description" content="Organization validation reports for %(name)s (GCDS theme)." />
+  <title>%(name)s · GCDS Validation Reports</title>
   <link rel="stylesheet" href="{GCDS_CSS_SHORTCUTS}" />
   <link rel="stylesheet" href="{GCDS_COMPONENTS_CSS}" />
   <link rel="stylesheet" href="../gc_style.css" />
@@ -1721,11 +2195,11 @@ def write_gcds_org_pages(org_groups, out_dir):
     <gcds-container id="main-content" main-container size="xl" centered tag="main">
       <section class="panel section">
         <div class="actions" style="justify-content:space-between">
-          <div class="h1">{html.escape(group['name'])}</div>
+          <div class="h1">%(name)s</div>
           <div class="actions">
             <a class="btn secondary" href="../gc_index.html">All reports</a>
             <a class="btn secondary" href="index.html">Organizations</a>
-            <a class="btn secondary" href="../organizations/{html.escape(group['slug'])}.html">Primary view</a>
+            <a class="btn secondary" href="../organizations/%(slug)s.html">Primary view</a>
             <div class="lang-toggle">
               <button type="button" class="btn" data-set="en" onclick="setLang('en')">EN</button>
               <button type="button" class="btn" data-set="fr" onclick="setLang('fr')">FR</button>
@@ -1733,24 +2207,24 @@ def write_gcds_org_pages(org_groups, out_dir):
           </div>
         </div>
         <p class="subtle" style="margin-top:12px">
-          Total reports: {group['total']} · Success: {success} · Failure: {failure} · Other: {max(other, 0)} · URL types: {url_types_count} · Latest: <time>{html.escape(latest_created)}</time>
+          Total reports: %(total)s · Success: %(success)s · Failure: %(failure)s · Other: %(other)s · URL types: %(url_types_count)s · Latest: <time>%(latest)s</time>
         </p>
         <div class="summary-grid">
           <div class="summary-tile">
             <div class="label">Total reports</div>
-            <div class="value">{group['total']}</div>
+            <div class="value">%(total)s</div>
           </div>
           <div class="summary-tile">
             <div class="label">Success</div>
-            <div class="value" style="color:var(--gc-good)">{success}</div>
+            <div class="value" style="color:var(--gc-good)">%(success)s</div>
           </div>
           <div class="summary-tile">
             <div class="label">Failure</div>
-            <div class="value" style="color:var(--gc-bad)">{failure}</div>
+            <div class="value" style="color:var(--gc-bad)">%(failure)s</div>
           </div>
           <div class="summary-tile">
             <div class="label">URL types</div>
-            <div class="value">{url_types_count}</div>
+            <div class="value">%(url_types_count)s</div>
           </div>
         </div>
       </section>
@@ -1774,11 +2248,11 @@ def write_gcds_org_pages(org_groups, out_dir):
               <tr>
                 <th>URL type</th>
                 <th>Total</th>
-                {status_table_headers}
+                %(status_headers)s
               </tr>
             </thead>
             <tbody>
-              {''.join(status_table_rows)}
+              %(status_rows)s
             </tbody>
           </table>
         </div>
@@ -1848,11 +2322,12 @@ def write_gcds_org_pages(org_groups, out_dir):
                 </th>
               </tr>
             </thead>
-            <tbody>
-              {''.join(report_rows)}
-            </tbody>
+            <tbody></tbody>
           </table>
         </div>
+        """
+
+_GC_ORG_PAGE_TAIL = """
 
         <div class="pager">
           <span class="subtle" id="pager-info"></span>
@@ -1868,68 +2343,77 @@ def write_gcds_org_pages(org_groups, out_dir):
         </div>
       </section>
 
-      <gcds-date-modified>{datetime.utcnow().strftime("%Y-%m-%d")}</gcds-date-modified>
+      <gcds-date-modified>%(today)s</gcds-date-modified>
     </gcds-container>
   </div>
   <gcds-footer display="full" contextual-heading="Canadian Digital Service"></gcds-footer>
   <script>
-    document.addEventListener('DOMContentLoaded', function(){{
+    document.addEventListener('DOMContentLoaded', function(){
       const tickColor = '#1b1b1b';
       const gridColor = 'rgba(0,0,0,0.08)';
-      const statusData = {summary["status_data_json"]};
-      const urlTypeData = {summary["url_chart_json"]};
-      if(window.Chart){{
+      const statusData = %(status_data_json)s;
+      const urlTypeData = %(url_chart_json)s;
+      if(window.Chart){
         const statusCanvas = document.getElementById('statusChart');
-        if(statusCanvas){{
-          new Chart(statusCanvas.getContext('2d'), {{
+        if(statusCanvas){
+          new Chart(statusCanvas.getContext('2d'), {
             type: 'pie',
             data: statusData,
-            options: {{
-              plugins: {{
-                legend: {{
+            options: {
+              plugins: {
+                legend: {
                   position: 'bottom',
-                  labels: {{ color: tickColor }}
-                }}
-              }}
-            }}
-          }});
-        }}
+                  labels: { color: tickColor }
+                }
+              }
+            }
+          });
+        }
         const urlCanvas = document.getElementById('urlTypeChart');
-        if(urlCanvas){{
-          new Chart(urlCanvas.getContext('2d'), {{
+        if(urlCanvas){
+          new Chart(urlCanvas.getContext('2d'), {
             type: 'bar',
             data: urlTypeData,
-            options: {{
-              plugins: {{
-                legend: {{
-                  labels: {{ color: tickColor }}
-                }}
-              }},
+            options: {
+              plugins: {
+                legend: {
+                  labels: { color: tickColor }
+                }
+              },
               responsive: true,
-              scales: {{
-                x: {{
+              scales: {
+                x: {
                   stacked: true,
-                  ticks: {{ color: tickColor }},
-                  grid: {{ color: gridColor }}
-                }},
-                y: {{
+                  ticks: { color: tickColor },
+                  grid: { color: gridColor }
+                },
+                y: {
                   stacked: true,
-                  ticks: {{ color: tickColor }},
-                  grid: {{ color: gridColor }},
+                  ticks: { color: tickColor },
+                  grid: { color: gridColor },
                   beginAtZero: true
-                }}
-              }}
-            }}
-          }});
-        }}
-      }}
-    }});
+                }
+              }
+            }
+          });
+        }
+      }
+    });
   </script>
 </body>
 </html>
 """
-        with open(os.path.join(org_dir, f"{group['slug']}.html"), "w", encoding="utf-8") as f:
-            f.write(page_html)
+
+def write_gcds_org_pages(org_groups, out_dir):
+    org_dir = os.path.join(out_dir, "gc_organizations")
+    os.makedirs(org_dir, exist_ok=True)
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+
+    for group in org_groups:
+        fields = org_page_fields(group)
+        fields["today"] = today
+        write_file(os.path.join(org_dir, f"{group['slug']}.html"), (_GC_ORG_PAGE_HEAD % fields).encode("utf-8"),
+                   render_report_data(group["items"], "../gc_reports"), (_GC_ORG_PAGE_TAIL % fields).encode("utf-8"))
 
 ############################################################
 # Main
@@ -1943,13 +2427,11 @@ def main():
     if not build_primary and not build_gcds:
         build_primary = True
 
-    with open(os.path.join(OUT_DIR, "style.css"), "w", encoding="utf-8") as f:
-        f.write(CSS)
-    with open(os.path.join(OUT_DIR, "app.js"), "w", encoding="utf-8") as f:
-        f.write(JS)
+    write_file(os.path.join(OUT_DIR, "style.css"), CSS.encode("utf-8"))
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+    write_file(os.path.join(OUT_DIR, "app.js"), (f'const BUILD_DATE = "{today}";\n' + JS).encode("utf-8"))
     if build_gcds:
-        with open(os.path.join(OUT_DIR, "gc_style.css"), "w", encoding="utf-8") as f:
-            f.write(GC_CSS)
+        write_file(os.path.join(OUT_DIR, "gc_style.css"), GC_CSS.encode("utf-8"))
 
     items=read_items(IN_PATH)
     org_groups = build_org_groups(items)
@@ -1960,19 +2442,25 @@ def main():
     if build_primary:
         write_index(items, OUT_DIR)
         write_org_index(org_groups, OUT_DIR)
-        write_report_pages(items, OUT_DIR, org_lookup)
         write_org_pages(org_groups, OUT_DIR)
         themes_rendered.append("primary")
 
     if build_gcds:
         write_gcds_index(items, org_groups, OUT_DIR)
-        write_gcds_report_pages(items, OUT_DIR, org_lookup)
         write_gcds_org_index(org_groups, OUT_DIR)
         write_gcds_org_pages(org_groups, OUT_DIR)
         themes_rendered.append("gcds")
 
+    # the listing rows are done with; drop them so the streamed pass (and any forked
+    # workers) only ever hold the record currently being rendered
+    n_items = len(items)
+    del items, org_groups
+
+    # one streamed pass renders each report body once for every theme being built
+    write_report_pages(IN_PATH, OUT_DIR, org_lookup, primary=build_primary, gcds=build_gcds)
+
     theme_label = ", ".join(themes_rendered) if themes_rendered else "none"
-    print(f"✓ Site built ({theme_label}): {OUT_DIR}/  reports: {len(items)}")
+    print(f"✓ Site built ({theme_label}): {OUT_DIR}/  reports: {n_items}")
 
 if __name__ == "__main__":
     main()
@@ -20,7 +20,7 @@ ENV (optional):
   OD_JSONL_GZ_PATH       default: od-do-canada.jsonl.gz
 """
 
-import os, sys, json, gzip, urllib.request, ujson
+import os, sys, gzip, urllib.request, orjson
 
 IN_PATH   = os.getenv("VALIDATION_JSONL_IN",  "validation.jsonl")
 OUT_PATH  = os.getenv("VALIDATION_JSONL_OUT", "validation_enriched.jsonl")
@@ -85,10 +85,11 @@ def normalize_url_type(value):
 def build_resource_index(od_jsonl_gz_path):
     """resource_id -> metadata (incl. normalized url_type and status)."""
     idx = {}
-    with gzip.open(od_jsonl_gz_path, "rt", encoding="utf-8", newline="") as fin:
+    # bytes lines go straight to orjson: no text-layer decode of the (large) dump
+    with gzip.open(od_jsonl_gz_path, "rb") as fin:
         for line in fin:
             try:
-                ds = ujson.loads(line)
+                ds = orjson.loads(line)
             except ValueError:
                 continue
 
@@ -130,11 +131,11 @@ def main():
     idx = build_resource_index(OD_PATH)
 
     added = kept = dropped = total = 0
-    with open(IN_PATH, "r", encoding="utf-8") as fin, open(OUT_PATH, "w", encoding="utf-8") as fout:
+    with open(IN_PATH, "rb") as fin, open(OUT_PATH, "wb") as fout:
         for line in fin:
             total += 1
             try:
-                obj = ujson.loads(line)
+                obj = orjson.loads(line)
             except ValueError:
                 continue
 
@@ -152,7 +153,8 @@ def main():
             obj.update(meta)
             added += 1
             kept += 1
-            fout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            # already UTF-8 bytes: written as-is, no text-layer encode per record
+            fout.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
 
     log(f"✓ Enriched {added}/{total} rows, kept {kept}, dropped {dropped}")
 
@@ -0,0 +1,70 @@
+import io, os, sys, tempfile, unittest
+
+import orjson
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+import build_site
+
+
+def load_items(records):
+    """Parse `records` through build_site.iter_items() via a temporary JSONL file."""
+    with tempfile.NamedTemporaryFile("wb", suffix=".jsonl", delete=False) as f:
+        for rec in records:
+            f.write(orjson.dumps(rec) + b"\n")
+    try:
+        return list(build_site.iter_items(f.name))
+    finally:
+        os.unlink(f.name)
+
+
+class RawReportTest(unittest.TestCase):
+
+    def test_v01_raw_keeps_hyphenated_counts(self):
+        report = {"en": {"tables": [{"valid": False, "row-count": 5, "error-count": 1, "source": "a.csv"}]}}
+        it, = load_items([{"id": "res-1", "reports": report}])
+        # the renderers see the underscore spelling...
+        table = it["lang_data"]["en"][0]
+        self.assertEqual((table["row_count"], table["error_count"]), (5, 1))
+        self.assertEqual(it["en"]["rows"], 5)
+        # ...while the raw side file is the report as it arrived
+        with tempfile.TemporaryDirectory() as tmp:
+            build_site._write_report_page(it, raw_prefix=tmp + os.sep)
+            with open(os.path.join(tmp, "res-1.json"), "rb") as f:
+                raw = orjson.loads(f.read())
+        self.assertEqual(raw, report)
+        self.assertEqual(list(raw["en"]["tables"][0]), ["valid", "row-count", "error-count", "source"])
+
+
+class CreatedMsTest(unittest.TestCase):
+
+    def test_naive_stamp_is_utc(self):
+        self.assertEqual(build_site.created_ms("2024-03-01T12:00:00"), 1709294400000)
+        self.assertEqual(build_site.created_ms("2024-03-01"), 1709251200000)
+
+    def test_offset_stamp(self):
+        self.assertEqual(build_site.created_ms("2024-03-01T14:00:00+02:00"), 1709294400000)
+        self.assertEqual(build_site.created_ms("2024-03-01T12:00:00.250+00:00"), 1709294400250)
+
+    def test_malformed_stamp_is_zero(self):
+        for stamp in ("", "N/A", "2024-13-45", "yesterday"):
+            self.assertEqual(build_site.created_ms(stamp), 0, stamp)
+
+
+class TaskBlockTest(unittest.TestCase):
+
+    def render(self, task):
+        buf = io.StringIO()
+        build_site.render_task_block(buf.write, task)
+        return buf.getvalue()
+
+    def test_type_and_stats_are_escaped(self):
+        html = self.render({"type": "<script>alert(1)</script>",
+                            "stats": {"rows": "<script>x</script>", "md5": "a&b"}})
+        self.assertNotIn("<script>", html)
+        self.assertIn("<div>Type</div><div>&lt;script&gt;alert(1)&lt;/script&gt;</div>", html)
+        self.assertIn("<div>Rows</div><div>&lt;script&gt;x&lt;/script&gt;</div>", html)
+        self.assertIn("<div>MD5</div><div>a&amp;b</div>", html)
+
+
+if __name__ == "__main__":
+    unittest.main()